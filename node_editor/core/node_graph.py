@@ -2,6 +2,9 @@ import uuid
 
 class Node:
     category = "Uncategorized"  # Default category for nodes
+    gray_sink = False  # True if the node reduces its input to grayscale before use
+    adapts_to_outputs = False  # True if process() output depends on the connected consumers
+    thread_safe = False  # True if separate instances may process() concurrently in one process
 
     def __init__(self, name, params=None):
         self.id = str(uuid.uuid4())
@@ -16,12 +19,16 @@ class Node:
         if node not in self.inputs:
             self.inputs.append(node)
             node.outputs.append(self)
+            if node.adapts_to_outputs:
+                node.set_dirty()
             self.set_dirty()
 
     def remove_input(self, node):
         if node in self.inputs:
             self.inputs.remove(node)
             node.outputs.remove(self)
+            if node.adapts_to_outputs:
+                node.set_dirty()
             self.set_dirty()
 
     @property
@@ -48,6 +55,10 @@ class Node:
         else:
             raise KeyError(f"Parameter '{name}' not found in node '{self.name}'")
 
+    def outputs_gray_only(self):
+        """Whether every consumer of this node only reads grayscale data."""
+        return bool(self.outputs) and all(node.gray_sink for node in self.outputs)
+
     def process(self, input_data):
         raise NotImplementedError
 
@@ -4,6 +4,8 @@ Batch Processing Worker - QThread for processing multiple images through a workf
 import cv2
 import os
 import traceback
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+from itertools import islice
 from pathlib import Path
 from typing import List, Dict
 
@@ -39,49 +41,104 @@ class BatchProcessingWorker(QThread):
             os.makedirs(self.output_folder, exist_ok=True)
 
             total = len(self.image_paths)
-
-            for idx, image_path in enumerate(self.image_paths):
-                if not self._is_running:
-                    break
-
-                filename = Path(image_path).name
-                self.progress.emit(idx + 1, total, filename)
-
-                try:
-                    result = self._process_single_image(image_path)
-
-                    if result is not None:
-                        # Generate output filename
-                        stem = Path(image_path).stem
-                        suffix = Path(image_path).suffix or ".png"
-                        output_filename = f"{stem}_processed{suffix}"
-                        output_path = os.path.join(self.output_folder, output_filename)
-
-                        # Handle duplicate filenames
-                        counter = 1
-                        while os.path.exists(output_path):
-                            output_filename = f"{stem}_processed_{counter}{suffix}"
-                            output_path = os.path.join(self.output_folder, output_filename)
-                            counter += 1
-
-                        # Convert RGB to BGR for OpenCV saving
-                        if len(result.shape) == 3:
-                            result_bgr = cv2.cvtColor(result, cv2.COLOR_RGB2BGR)
-                        else:
-                            result_bgr = result
-
-                        cv2.imwrite(output_path, result_bgr)
-                        self.image_completed.emit(output_path, result)
-
-                except Exception as e:
-                    print(f"Error processing {filename}: {e}")
-                    traceback.print_exc()
+            if total == 0:
+                self.finished.emit()
+                return
+
+            # Each image gets its own graph, so images can run in parallel;
+            # the OpenCV calls inside the nodes release the GIL. AI nodes
+            # load a whole model per instance, so those workflows run serially.
+            cpu_count = os.cpu_count() or 1
+            max_workers = min(total, cpu_count) if self._is_parallel_safe() else 1
+
+            # One OpenCV thread pool per worker would oversubscribe the CPU
+            cv_threads = cv2.getNumThreads()
+            if max_workers > 1:
+                cv2.setNumThreads(max(1, cpu_count // max_workers))
+
+            try:
+                self._run_pool(max_workers, total)
+            finally:
+                cv2.setNumThreads(cv_threads)
 
             self.finished.emit()
 
         except Exception as e:
             self.error.emit(f"Batch processing failed:\n{traceback.format_exc()}")
 
+    def _is_parallel_safe(self) -> bool:
+        """Whether every node in the workflow may run in several graphs at once."""
+        for node_data in self.workflow_data.get('nodes', []):
+            node_class = NODE_TYPES.get(node_data.get('type'))
+            if node_class is None or not node_class.thread_safe:
+                return False
+        return True
+
+    def _run_pool(self, max_workers: int, total: int):
+        """Process all images on a pool of max_workers threads."""
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            # Keep a bounded window of images in flight: the next images
+            # are already being decoded while earlier results are saved,
+            # but finished results are not all held in memory at once.
+            paths = iter(self.image_paths)
+            pending = {
+                executor.submit(self._process_single_image, image_path): image_path
+                for image_path in islice(paths, max_workers * 2)
+            }
+            done = 0
+
+            while pending and self._is_running:
+                finished, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in finished:
+                    if not self._is_running:
+                        break
+
+                    image_path = pending.pop(future)
+                    next_path = next(paths, None)
+                    if next_path is not None:
+                        pending[executor.submit(self._process_single_image, next_path)] = next_path
+
+                    done += 1
+                    filename = Path(image_path).name
+                    self.progress.emit(done, total, filename)
+
+                    try:
+                        result = future.result()
+                        if result is not None:
+                            output_path = self._save_result(image_path, result)
+                            self.image_completed.emit(output_path, result)
+
+                    except Exception as e:
+                        print(f"Error processing {filename}: {e}")
+                        traceback.print_exc()
+
+            for future in pending:
+                future.cancel()
+
+    def _save_result(self, image_path: str, result) -> str:
+        """Write a processed image next to its siblings and return the output path."""
+        # Generate output filename
+        stem = Path(image_path).stem
+        suffix = Path(image_path).suffix or ".png"
+        output_filename = f"{stem}_processed{suffix}"
+        output_path = os.path.join(self.output_folder, output_filename)
+
+        # Handle duplicate filenames
+        counter = 1
+        while os.path.exists(output_path):
+            output_filename = f"{stem}_processed_{counter}{suffix}"
+            output_path = os.path.join(self.output_folder, output_filename)
+            counter += 1
+
+        # Convert RGB to BGR for OpenCV saving
+        if result.ndim == 3:
+            result_bgr = cv2.cvtColor(result, cv2.COLOR_RGB2BGR)
+        else:
+            result_bgr = result
+
+        cv2.imwrite(output_path, result_bgr)
+        return output_path
+
     def _process_single_image(self, image_path: str):
         """
         Process a single image through the workflow.
@@ -31,6 +31,7 @@ class NodeEditorPage(QWidget):
         self.graph = NodeGraph()
         self.workflow_manager = WorkflowManager()
         self.scene = NodeEditorScene(self)
+        self.scene.set_graph(self.graph)
         self.view = NodeEditorView(self.scene)
         self.current_selected_node_id = None
         self.worker = None
@@ -136,11 +137,7 @@ class NodeEditorPage(QWidget):
 
     def _get_node_widgets_map(self):
         """Get a dict mapping node_id to NodeWidget."""
-        widgets = {}
-        for item in self.scene.items():
-            if isinstance(item, NodeWidget):
-                widgets[item.node_id] = item
-        return widgets
+        return {item.node_id: item for item in self.scene.node_widgets()}
 
     def _save_current_workflow(self):
         """Save the current graph as a workflow."""
@@ -244,7 +241,8 @@ class NodeEditorPage(QWidget):
         # Build a map from new_id to widget for edge creation
         widget_map = self._get_node_widgets_map()
 
-        # Recreate edges
+        # Recreate edges; paths are built in one pass before they join the scene
+        edges = []
         for conn in workflow_data.get('connections', []):
             from_old_id = conn['from_node']
             to_old_id = conn['to_node']
@@ -255,8 +253,13 @@ class NodeEditorPage(QWidget):
                 from_widget = widget_map.get(from_new_id)
                 to_widget = widget_map.get(to_new_id)
                 if from_widget and to_widget:
-                    edge = EdgeWidget(from_widget.output_port, to_widget.input_port)
-                    self.scene.addItem(edge)
+                    edges.append(EdgeWidget(
+                        from_widget.output_port, to_widget.input_port, build_path=False
+                    ))
+
+        EdgeWidget.rebuild_many(edges)
+        for edge in edges:
+            self.scene.addItem(edge)
 
     def _clear_graph(self):
         """Clear all nodes and connections."""
@@ -306,8 +309,8 @@ class NodeEditorPage(QWidget):
             if filepath:
                 node.set_parameter(param_name, filepath)
                 # Update the widget's display
-                for item in self.scene.items():
-                    if isinstance(item, NodeWidget) and item.node_id == node_id:
+                for item in self.scene.node_widgets():
+                    if item.node_id == node_id:
                         item.update_filepath_display(param_name, filepath)
                         break
 
@@ -322,9 +325,14 @@ class NodeEditorPage(QWidget):
         if node and node.cached_data is not None:
             filepath, _ = QFileDialog.getSaveFileName(self, "Save Image", "", "PNG Image (*.png);;JPG Image (*.jpg)")
             if filepath:
+                # Nodes reuse their output buffers, so snapshot the data in
+                # case a running worker is rewriting it
                 image = node.cached_data
+                if image is None:
+                    return
+                image = image.copy()
                 # Convert RGB (internal) to BGR (for OpenCV) before saving
-                if len(image.shape) == 3:
+                if image.ndim == 3:
                     image = cv2.cvtColor(image, cv2.COLOR_RGB2BGR)
                 cv2.imwrite(filepath, image)
                 print(f"Saved output of node {node.name} to {filepath}")
@@ -370,8 +378,8 @@ class NodeEditorPage(QWidget):
         if np_image is None:
             return
         # Find the Output node widget that was executed
-        for item in self.scene.items():
-            if isinstance(item, NodeWidget) and item.node_id == self.current_selected_node_id:
+        for item in self.scene.node_widgets():
+            if item.node_id == self.current_selected_node_id:
                 item.set_preview_image(np_image)
                 break
 
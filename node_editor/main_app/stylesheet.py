@@ -21,8 +21,8 @@ QDockWidget::title {
     border-radius: 4px;
 }
 
-/* Tree Widget for Node Palette */
-QTreeWidget {
+/* Tree View for Node Palette */
+QTreeView {
     background-color: #2D3142;
     border: 1px solid #3D4259;
     border-radius: 6px;
@@ -30,32 +30,32 @@ QTreeWidget {
     padding: 4px;
 }
 
-QTreeWidget::item {
+QTreeView::item {
     padding: 10px 12px;
     border-radius: 4px;
     margin: 2px 0;
 }
 
-QTreeWidget::item:hover {
+QTreeView::item:hover {
     background-color: #3D4259;
 }
 
-QTreeWidget::item:selected {
+QTreeView::item:selected {
     background-color: #5C6BC0;
     color: #FFFFFF;
 }
 
-QTreeWidget::branch {
+QTreeView::branch {
     background-color: transparent;
 }
 
-QTreeWidget::branch:has-children:!has-siblings:closed,
-QTreeWidget::branch:closed:has-children:has-siblings {
+QTreeView::branch:has-children:!has-siblings:closed,
+QTreeView::branch:closed:has-children:has-siblings {
     image: url(node_editor/icons/chevron-right.svg);
 }
 
-QTreeWidget::branch:open:has-children:!has-siblings,
-QTreeWidget::branch:open:has-children:has-siblings {
+QTreeView::branch:open:has-children:!has-siblings,
+QTreeView::branch:open:has-children:has-siblings {
     image: url(node_editor/icons/chevron-down.svg);
 }
 
@@ -345,4 +345,67 @@ QInputDialog QLabel {
 QInputDialog QLineEdit {
     min-width: 300px;
 }
+
+/* Widgets embedded in graph nodes (styled by object name so the sheet is
+   parsed once instead of per node) */
+QWidget#paramRow {
+    background: transparent;
+}
+
+QWidget#paramRow QAbstractSpinBox QLineEdit {
+    background: transparent;
+}
+
+QLabel#paramLabel {
+    color: #AAA; font-size: 9px; background: transparent;
+}
+
+QSpinBox#paramSpin, QDoubleSpinBox#paramDoubleSpin {
+    background: #3A3A3A; border: 1px solid #555;
+    border-radius: 3px; color: #DDD; font-size: 9px;
+}
+
+QLabel#fileLabel {
+    color: #8CF; font-size: 9px; background: transparent;
+}
+
+QPushButton#fileBtn {
+    background: #4A4A4A; border: 1px solid #555;
+    border-radius: 3px; color: #DDD; font-size: 9px;
+}
+
+QPushButton#fileBtn:hover {
+    background: #5A5A5A;
+}
+
+QPushButton#saveBtn {
+    background: #2D7D46; border: none;
+    border-radius: 4px; color: #FFF; font-size: 10px; font-weight: bold;
+}
+
+QPushButton#saveBtn:hover {
+    background: #3D8D56;
+}
+
+QPushButton#saveBtn:disabled {
+    background: #555; color: #888;
+}
+
+/* Workflow cards; selection is the dynamic "selected" property */
+WorkflowCard {
+    background: #353849;
+    border: 1px solid #4A4F6A;
+    border-radius: 8px;
+    padding: 8px;
+}
+
+WorkflowCard:hover {
+    border-color: #5C6BC0;
+    background: #3D4259;
+}
+
+WorkflowCard[selected="true"] {
+    background: #3D4259;
+    border: 2px solid #7986CB;
+}
 """
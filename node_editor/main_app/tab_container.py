@@ -48,7 +48,7 @@ class DetachedWindow(QMainWindow):
     def __init__(self, widget, title, icon, parent=None):
         super().__init__(parent)
         self.setWindowTitle(title)
-        if icon:
+        if icon is not None and not icon.isNull():
             self.setWindowIcon(icon)
         self.setCentralWidget(widget)
         self.resize(1400, 800)
@@ -65,6 +65,9 @@ class DetachedWindow(QMainWindow):
 class DetachableTabWidget(QTabWidget):
     """Tab widget that allows tabs to be detached into separate windows."""
 
+    # Shared fallback for tabs added without an icon
+    _NULL_ICON = QIcon()
+
     def __init__(self, parent=None):
         super().__init__(parent)
 
@@ -95,7 +98,7 @@ class DetachableTabWidget(QTabWidget):
 
         widget = self.widget(index)
         title = self.tabText(index)
-        icon = self._tab_icons.get(id(widget), QIcon())
+        icon = self._tab_icons.get(id(widget), self._NULL_ICON)
 
         self.removeTab(index)
 
@@ -111,7 +114,7 @@ class DetachableTabWidget(QTabWidget):
         if sender in self._detached_windows:
             self._detached_windows.remove(sender)
 
-        if icon:
+        if icon is not None and not icon.isNull():
             self._tab_icons[id(widget)] = icon
             self.addTab(widget, icon, title)
         else:
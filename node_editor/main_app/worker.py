@@ -32,7 +32,7 @@ class GraphExecutionWorker(QThread):
                 # All nodes are cached
                 self.progress_update.emit("Using cached results...", "", 100)
                 if self.is_running:
-                    self.result_ready.emit(target_node.cached_data)
+                    self.result_ready.emit(self._detached(target_node.cached_data))
                 return
 
             for i, node in enumerate(nodes_to_execute):
@@ -53,12 +53,21 @@ class GraphExecutionWorker(QThread):
             self.progress_update.emit("Complete", "", 100)
 
             if self.is_running:
-                self.result_ready.emit(target_node.cached_data)
+                self.result_ready.emit(self._detached(target_node.cached_data))
 
         except Exception as e:
             error_msg = f"An error occurred during graph execution:\n{traceback.format_exc()}"
             self.error_occurred.emit(error_msg)
 
+    @staticmethod
+    def _detached(data):
+        """
+        Copy a result before it leaves the worker thread. Nodes reuse their
+        output buffers, so the next run could otherwise overwrite an array
+        the GUI is still reading.
+        """
+        return data.copy() if data is not None else None
+
     def _get_execution_order(self, target_node, visited=None):
         """Get nodes in execution order (topological sort) that need execution."""
         if visited is None:
@@ -24,21 +24,33 @@ def register_nodes():
 
         # Find all Node subclasses in the imported module
         for name, obj in inspect.getmembers(module, inspect.isclass):
+            # Only register classes defined in this module, not re-exported imports
+            if obj.__module__ != module.__name__:
+                continue
             if issubclass(obj, Node) and obj is not Node:
                 # Use the node's internal name for registration
                 try:
                     instance = obj()
-                    NODE_TYPES[instance.name] = obj
-
-                    # Build category mapping
-                    category = getattr(obj, 'category', 'Uncategorized')
-                    if category not in NODE_CATEGORIES:
-                        NODE_CATEGORIES[category] = []
-                    NODE_CATEGORIES[category].append(instance.name)
-
-                    print(f"Successfully registered node: {instance.name} ({category})")
                 except Exception as e:
                     print(f"Could not instantiate or register node {name}: {e}")
+                    continue
+
+                existing = NODE_TYPES.get(instance.name)
+                if existing is not None and existing is not obj:
+                    raise RuntimeError(
+                        f"Node name '{instance.name}' is defined by both "
+                        f"{existing.__module__}.{existing.__name__} and {module.__name__}.{name}"
+                    )
+
+                NODE_TYPES[instance.name] = obj
+
+                # Build category mapping
+                category = getattr(obj, 'category', 'Uncategorized')
+                if category not in NODE_CATEGORIES:
+                    NODE_CATEGORIES[category] = []
+                NODE_CATEGORIES[category].append(instance.name)
+
+                print(f"Successfully registered node: {instance.name} ({category})")
 
 # Call registration function when this package is imported
 register_nodes()
\ No newline at end of file
@@ -4,6 +4,7 @@ from node_editor.core.node_graph import Node
 
 class InputNode(Node):
     category = "Basic I/O"
+    thread_safe = True
 
     def __init__(self):
         super().__init__("Input", params={'filepath': {'type': 'filepath', 'value': ''}})
@@ -19,6 +20,7 @@ class InputNode(Node):
 
 class OutputNode(Node):
     category = "Basic I/O"
+    thread_safe = True
 
     def __init__(self): super().__init__("Output")
     def process(self, input_data): return input_data[0] if input_data else None
@@ -7,6 +7,7 @@ from PySide6.QtWidgets import (
 )
 from PySide6.QtCore import Qt, Signal
 from pathlib import Path
+import os
 
 
 class ImageSelector(QWidget):
@@ -15,10 +16,12 @@ class ImageSelector(QWidget):
     selection_changed = Signal(list)  # list of file paths
 
     SUPPORTED_FORMATS = ["*.png", "*.jpg", "*.jpeg", "*.bmp", "*.tiff", "*.tif"]
+    SUPPORTED_EXTENSIONS = tuple(fmt[1:] for fmt in SUPPORTED_FORMATS)
 
     def __init__(self, parent=None):
         super().__init__(parent)
         self.image_paths = []
+        self._paths_set = set()  # O(1) duplicate checks alongside image_paths
         self._setup_ui()
 
     def _setup_ui(self):
@@ -86,11 +89,7 @@ class ImageSelector(QWidget):
             self, "Select Images", "", filter_str
         )
 
-        for f in files:
-            if f not in self.image_paths:
-                self.image_paths.append(f)
-                self.file_list.addItem(Path(f).name)
-
+        self._append_paths(files)
         self._update_summary()
         self.selection_changed.emit(self.image_paths)
 
@@ -99,24 +98,32 @@ class ImageSelector(QWidget):
         folder = QFileDialog.getExistingDirectory(self, "Select Folder")
 
         if folder:
-            folder_path = Path(folder)
-            for pattern in self.SUPPORTED_FORMATS:
-                for f in folder_path.glob(pattern):
-                    if str(f) not in self.image_paths:
-                        self.image_paths.append(str(f))
-                        self.file_list.addItem(f.name)
-                # Also check case-insensitive
-                for f in folder_path.glob(pattern.upper()):
-                    if str(f) not in self.image_paths:
-                        self.image_paths.append(str(f))
-                        self.file_list.addItem(f.name)
+            # Single directory pass with a case-insensitive extension test
+            with os.scandir(folder) as entries:
+                found = sorted(
+                    entry.path for entry in entries
+                    if entry.is_file() and entry.name.lower().endswith(self.SUPPORTED_EXTENSIONS)
+                )
+            self._append_paths(found)
 
         self._update_summary()
         self.selection_changed.emit(self.image_paths)
 
+    def _append_paths(self, paths):
+        """Append new paths, skipping duplicates, with one list-widget update."""
+        new_paths = []
+        for path in paths:
+            if path not in self._paths_set:
+                self._paths_set.add(path)
+                new_paths.append(path)
+
+        self.image_paths.extend(new_paths)
+        self.file_list.addItems([Path(p).name for p in new_paths])
+
     def _clear(self):
         """Clear all selected images."""
         self.image_paths.clear()
+        self._paths_set.clear()
         self.file_list.clear()
         self._update_summary()
         self.selection_changed.emit(self.image_paths)
@@ -138,8 +145,5 @@ class ImageSelector(QWidget):
     def set_images(self, image_paths):
         """Set the list of images programmatically."""
         self._clear()
-        for path in image_paths:
-            if path not in self.image_paths:
-                self.image_paths.append(path)
-                self.file_list.addItem(Path(path).name)
+        self._append_paths(image_paths)
         self._update_summary()
@@ -12,12 +12,22 @@ class LoadingSpinner(QWidget):
         self._angle = 0
         self.setAttribute(Qt.WA_TranslucentBackground)
 
+        # Gradient and pen never change, so build them once
+        gradient = QConicalGradient(0, 0, 0)
+        gradient.setColorAt(0, QColor("#007ACC"))
+        gradient.setColorAt(0.7, QColor("#007ACC"))
+        gradient.setColorAt(1, QColor(0, 122, 204, 0))
+        self._pen = QPen(gradient, 5)
+        self._pen.setCapStyle(Qt.RoundCap)
+
         self.timer = QTimer(self)
         self.timer.timeout.connect(self._rotate)
-        self.timer.setInterval(16)  # ~60 FPS
+        self.timer.setInterval(33)  # ~30 FPS
 
     def _rotate(self):
-        self._angle = (self._angle + 6) % 360
+        if not self.isVisible():
+            return
+        self._angle = (self._angle + 12) % 360
         self.update()
 
     def start(self):
@@ -37,14 +47,7 @@ class LoadingSpinner(QWidget):
         painter.rotate(self._angle)
 
         # Draw spinning arc with gradient
-        gradient = QConicalGradient(0, 0, 0)
-        gradient.setColorAt(0, QColor("#007ACC"))
-        gradient.setColorAt(0.7, QColor("#007ACC"))
-        gradient.setColorAt(1, QColor(0, 122, 204, 0))
-
-        pen = QPen(gradient, 5)
-        pen.setCapStyle(Qt.RoundCap)
-        painter.setPen(pen)
+        painter.setPen(self._pen)
         painter.drawArc(
             int(-side / 2 + 8), int(-side / 2 + 8),
             int(side - 16), int(side - 16),
@@ -117,11 +120,14 @@ class LoadingOverlay(QWidget):
         self.detail_label.setAlignment(Qt.AlignCenter)
         layout.addWidget(self.detail_label)
 
+        self._pending_progress = None
+
         self.hide()
 
     def show_loading(self, message="Processing...", detail=""):
         self.message_label.setText(message)
         self.detail_label.setText(detail)
+        self._pending_progress = None
         self.progress_bar.setValue(0)
         self.percent_label.setText("0%")
         self.spinner.start()
@@ -140,5 +146,16 @@ class LoadingOverlay(QWidget):
 
     def set_progress(self, percent):
         """Set the progress bar value (0-100)."""
+        # Updates can arrive faster than we repaint; only apply the latest
+        # one once control returns to the event loop.
+        if self._pending_progress is None:
+            QTimer.singleShot(0, self._apply_progress)
+        self._pending_progress = percent
+
+    def _apply_progress(self):
+        percent = self._pending_progress
+        if percent is None:
+            return
+        self._pending_progress = None
         self.progress_bar.setValue(percent)
         self.percent_label.setText(f"{percent}%")
@@ -1,82 +1,256 @@
 from PySide6.QtWidgets import QGraphicsScene, QGraphicsLineItem, QGraphicsView, QMenu
-from PySide6.QtCore import Qt, QLineF
-from PySide6.QtGui import QPen, QColor
+from PySide6.QtCore import Qt, QLineF, QTimer
+from PySide6.QtGui import QPen, QColor, QTransform
 
-from node_editor.widgets.node_items import NodePort, EdgeWidget, COLOR_PORT
+from node_editor.widgets.node_items import NodeWidget, NodePort, EdgeWidget, COLOR_PORT, PORT_SIZE
+
+PORT_GRID_CELL = 64
+PORT_HIT_RADIUS = PORT_SIZE / 2 + 4
+# Edge rebuilds for dragged nodes run at most once per ~60 Hz frame
+EDGE_UPDATE_INTERVAL_MS = 16
+
+# Cosmetic so the drag line stays 2px at any zoom without rescaling the pen
+_RUBBER_PEN = QPen(COLOR_PORT, 2)
+_RUBBER_PEN.setCosmetic(True)
 
 class NodeEditorScene(QGraphicsScene):
     def __init__(self, parent=None):
         super().__init__(parent)
         self.setBackgroundBrush(QColor("#252836"))
-        self.line = None
+        # Node graphs hold at most a few hundred items and edges move on every
+        # drag, so a linear scan beats keeping a BSP tree up to date.
+        self.setItemIndexMethod(QGraphicsScene.NoIndex)
+        self._graph = None
         self.start_port = None
+        self._line_p1 = None
+        self._pending_pos = None
+        self._dragging = False
+
+        # Mouse events can arrive far faster than repaints; apply only the
+        # latest rubber line position once per event-loop pass.
+        self._update_timer = QTimer(self)
+        self._update_timer.setSingleShot(True)
+        self._update_timer.setInterval(0)
+        self._update_timer.timeout.connect(self._flush_rubber)
+
+        # Nodes moved since the last flush; their edges are rebuilt together
+        self._dirty_nodes = set()
+        self._edge_timer = QTimer(self)
+        self._edge_timer.setSingleShot(True)
+        self._edge_timer.setInterval(EDGE_UPDATE_INTERVAL_MS)
+        self._edge_timer.timeout.connect(self._flush_edges)
+
+        self._view = None
+        self._cached_transform = QTransform()
+        # (cell_x, cell_y) -> ports in that cell, for hit tests without itemAt
+        self._port_grid = {}
+        self._hover_port = None
+        # Top-level items by type, kept in sync by addItem/removeItem
+        self._nodes = set()
+        self._edges = set()
+        self._selected_edges = set()
+        self._deleting_edges = False
+        self.selectionChanged.connect(self._on_selection_changed)
+        self._create_rubber_line()
+
+    def _create_rubber_line(self):
+        """Create the hidden line shown while dragging a new connection."""
+        self._rubber_line = QGraphicsLineItem()
+        self._rubber_line.setPen(_RUBBER_PEN)
+        self._rubber_line.setVisible(False)
+        self.addItem(self._rubber_line)
+
+    def addItem(self, item):
+        super().addItem(item)
+        if isinstance(item, NodeWidget):
+            self._nodes.add(item)
+        elif isinstance(item, EdgeWidget):
+            self._edges.add(item)
+
+    def removeItem(self, item):
+        if isinstance(item, NodeWidget):
+            self._nodes.discard(item)
+            self._remove_port_cell(item.input_port)
+            self._remove_port_cell(item.output_port)
+            if self._hover_port is not None and self._hover_port.parentItem() is item:
+                self._hover_port = None
+        elif isinstance(item, EdgeWidget):
+            self._edges.discard(item)
+            item.detach()
+        super().removeItem(item)
+
+    def clear(self):
+        super().clear()
+        self._update_timer.stop()
+        self._edge_timer.stop()
+        self._dirty_nodes.clear()
+        self._nodes.clear()
+        self._edges.clear()
+        self._port_grid.clear()
+        self._hover_port = None
+        self._selected_edges.clear()
+        # clear() deletes every item, including the rubber line
+        self._dragging = False
+        self._create_rubber_line()
+
+    def set_graph(self, graph):
+        """Set the NodeGraph that edge edits are applied to."""
+        self._graph = graph
+
+    def node_widgets(self):
+        """Return the NodeWidgets currently in the scene."""
+        return self._nodes
+
+    def update_port_cell(self, port):
+        """Move a port to the grid cell matching its current scene position."""
+        pos = port.scenePos()
+        cell = (int(pos.x() // PORT_GRID_CELL), int(pos.y() // PORT_GRID_CELL))
+        if cell == port._grid_cell:
+            return
+        self._remove_port_cell(port)
+        self._port_grid.setdefault(cell, set()).add(port)
+        port._grid_cell = cell
+
+    def _remove_port_cell(self, port):
+        if port._grid_cell is None:
+            return
+        bucket = self._port_grid.get(port._grid_cell)
+        if bucket is not None:
+            bucket.discard(port)
+            if not bucket:
+                del self._port_grid[port._grid_cell]
+        port._grid_cell = None
+
+    def port_at(self, pos):
+        """Return the port under a scene position, or None."""
+        x, y = pos.x(), pos.y()
+        r = PORT_HIT_RADIUS
+        for cx in range(int((x - r) // PORT_GRID_CELL), int((x + r) // PORT_GRID_CELL) + 1):
+            for cy in range(int((y - r) // PORT_GRID_CELL), int((y + r) // PORT_GRID_CELL) + 1):
+                for port in self._port_grid.get((cx, cy), ()):
+                    p = port.scenePos()
+                    if (p.x() - x) ** 2 + (p.y() - y) ** 2 <= r * r:
+                        return port
+        return None
+
+    def set_hover_port(self, port):
+        """Move the hover highlight to port (or clear it with None)."""
+        if port is self._hover_port:
+            return
+        if self._hover_port is not None:
+            self._hover_port.set_hovered(False)
+        self._hover_port = port
+        if port is not None:
+            port.set_hovered(True)
+
+    def set_view(self, view):
+        """Register the view used for drag-mode changes and hit testing."""
+        self._view = view
+        self.set_view_transform(view.transform())
+
+    def set_view_transform(self, transform):
+        """Store the view transform that itemAt() is called with."""
+        self._cached_transform = transform
 
     def get_view(self):
         """Helper to get the first QGraphicsView associated with this scene."""
-        views = self.views()
-        return views[0] if views else None
+        if self._view is None:
+            views = self.views()
+            self._view = views[0] if views else None
+        return self._view
+
+    def schedule_edge_update(self, node_widget):
+        """Mark a node's edges for rebuilding with the next batched flush."""
+        self._dirty_nodes.add(node_widget)
+        if not self._edge_timer.isActive():
+            self._edge_timer.start()
 
-    def update_edges_for_node(self, node_widget):
-        for item in self.items():
-            if isinstance(item, EdgeWidget):
-                if item.start_port.parentItem() == node_widget or \
-                   item.end_port.parentItem() == node_widget:
-                    item.update_path()
+    def _flush_edges(self):
+        nodes, self._dirty_nodes = self._dirty_nodes, set()
+        edges = set()
+        for node_widget in nodes:
+            if node_widget.scene() is self:
+                edges.update(node_widget._incident_edges)
+        EdgeWidget.rebuild_many(edges)
 
     def edge_exists(self, start_port, end_port):
         """Check if an edge already exists between two ports."""
-        for item in self.items():
-            if isinstance(item, EdgeWidget):
-                if item.start_port == start_port and item.end_port == end_port:
-                    return True
-        return False
+        return end_port in start_port.outgoing
 
     def delete_edge(self, edge_widget):
         """Delete an edge from the scene and disconnect in the graph."""
         start_node_id = edge_widget.start_port.parentItem().node_id
         end_node_id = edge_widget.end_port.parentItem().node_id
-        self.parent().graph.disconnect(start_node_id, end_node_id)
+        self._graph.disconnect(start_node_id, end_node_id)
         self.removeItem(edge_widget)
 
+    def _on_selection_changed(self):
+        if self._deleting_edges:
+            return
+        self._selected_edges = {
+            item for item in self.selectedItems() if isinstance(item, EdgeWidget)
+        }
+
     def delete_selected_edges(self):
         """Delete all selected edges."""
-        for item in self.selectedItems():
-            if isinstance(item, EdgeWidget):
-                self.delete_edge(item)
+        edges = list(self._selected_edges)
+        if not edges:
+            return
+        # Removing each selected item emits selectionChanged; skip the
+        # per-item rescan of selectedItems() and update the set once.
+        self._deleting_edges = True
+        try:
+            for edge in edges:
+                self.delete_edge(edge)
+        finally:
+            self._deleting_edges = False
+        self._selected_edges.difference_update(edges)
 
     def mousePressEvent(self, event):
-        item = self.itemAt(event.scenePos(), self.get_view().transform())
+        view = self.get_view()
+        item = self.itemAt(event.scenePos(), self._cached_transform)
         if isinstance(item, NodePort) and item.is_output:
             self.start_port = item
-            self.line = QGraphicsLineItem(QLineF(self.start_port.scenePos(), event.scenePos()))
-            self.line.setPen(QPen(COLOR_PORT, 2))
-            self.addItem(self.line)
+            self._line_p1 = item.scenePos()
+            self._rubber_line.setLine(QLineF(self._line_p1, event.scenePos()))
+            self._rubber_line.setVisible(True)
+            self._dragging = True
 
             # Temporarily disable rubber band drag while connecting
-            view = self.get_view()
             if view:
                 view.setDragMode(QGraphicsView.NoDrag)
         else:
             super().mousePressEvent(event)
 
     def mouseMoveEvent(self, event):
-        if self.line:
-            self.line.setLine(QLineF(self.start_port.scenePos(), event.scenePos()))
+        self.set_hover_port(self.port_at(event.scenePos()))
+        if self._dragging:
+            self._pending_pos = event.scenePos()
+            if not self._update_timer.isActive():
+                self._update_timer.start()
         else:
             super().mouseMoveEvent(event)
 
+    def _flush_rubber(self):
+        if not self._dragging or self._pending_pos is None:
+            return
+        p1 = self._line_p1
+        pos = self._pending_pos
+        self._rubber_line.setLine(p1.x(), p1.y(), pos.x(), pos.y())
+
     def mouseReleaseEvent(self, event):
         # Restore rubber band drag mode
         view = self.get_view()
         if view:
             view.setDragMode(QGraphicsView.RubberBandDrag)
 
-        if self.line:
-            self.removeItem(self.line)
-            self.line = None
+        if self._dragging:
+            self._update_timer.stop()
+            self._rubber_line.setVisible(False)
+            self._dragging = False
 
             start_item = self.start_port
-            end_item = self.itemAt(event.scenePos(), self.get_view().transform())
+            end_item = self.port_at(event.scenePos())
 
             if isinstance(end_item, NodePort) and not end_item.is_output and end_item != start_item:
                 # Check if edge already exists (prevent duplicates)
@@ -87,13 +261,23 @@ class NodeEditorScene(QGraphicsScene):
                     start_node_widget = start_item.parentItem()
                     end_node_widget = end_item.parentItem()
 
-                    self.parent().graph.connect(start_node_widget.node_id, end_node_widget.node_id)
+                    self._graph.connect(start_node_widget.node_id, end_node_widget.node_id)
 
         super().mouseReleaseEvent(event)
 
     def contextMenuEvent(self, event):
         """Handle right-click context menu for edge deletion."""
-        item = self.itemAt(event.scenePos(), self.get_view().transform())
+        # Deleting a connection is the only action offered
+        if not self._edges:
+            super().contextMenuEvent(event)
+            return
+
+        # Ports sit on top of edge ends; no need for a full hit test there
+        if self.port_at(event.scenePos()) is not None:
+            super().contextMenuEvent(event)
+            return
+
+        item = self.itemAt(event.scenePos(), self._cached_transform)
 
         if isinstance(item, EdgeWidget):
             menu = QMenu()
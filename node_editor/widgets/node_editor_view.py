@@ -1,42 +1,108 @@
+import math
+
 from PySide6.QtWidgets import QGraphicsView
-from PySide6.QtCore import Qt
-from PySide6.QtGui import QPainter
+from PySide6.QtCore import Qt, QTimer
+from PySide6.QtGui import QPainter, QSurfaceFormat
+from PySide6.QtOpenGLWidgets import QOpenGLWidget
+
+ZOOM_STEP = math.log(1.25)
+
 
 class NodeEditorView(QGraphicsView):
     def __init__(self, scene, parent=None):
         super().__init__(scene, parent)
+
+        # Rasterize on the GPU; MSAA takes care of antialiasing
+        fmt = QSurfaceFormat()
+        fmt.setSamples(4)
+        gl_widget = QOpenGLWidget()
+        gl_widget.setFormat(fmt)
+        self.setViewport(gl_widget)
+        # A GL viewport repaints the whole frame anyway
+        self.setViewportUpdateMode(QGraphicsView.FullViewportUpdate)
+        # Every item paint() sets the pen/brush it draws with
+        self.setOptimizationFlags(
+            QGraphicsView.DontSavePainterState |
+            QGraphicsView.DontAdjustForAntialiasing
+        )
+        self.setCacheMode(QGraphicsView.CacheBackground)
+
+        # Items paint with the view's hints; antialiasing is dropped while
+        # panning/zooming and restored once interaction goes idle.
         self.setRenderHint(QPainter.Antialiasing)
+        self._idle_timer = QTimer(self)
+        self._idle_timer.setSingleShot(True)
+        self._idle_timer.setInterval(100)
+        self._idle_timer.timeout.connect(self._restore_antialiasing)
+
+        # Wheel ticks within one frame are folded into a single scale()
+        self._pending_zoom = 0.0
+        self._zoom_timer = QTimer(self)
+        self._zoom_timer.setSingleShot(True)
+        self._zoom_timer.setInterval(16)
+        self._zoom_timer.timeout.connect(self._apply_zoom)
         self.setDragMode(QGraphicsView.RubberBandDrag)
         self.setTransformationAnchor(QGraphicsView.AnchorUnderMouse)
         self.setResizeAnchor(QGraphicsView.AnchorUnderMouse)
         self._pan_start_mouse_pos = None
+        self._panning = False
+
+        # Let the scene skip views()/transform() lookups on every mouse event
+        scene.set_view(self)
+
+    def _sync_scene_transform(self):
+        scene = self.scene()
+        if scene is not None:
+            scene.set_view_transform(self.transform())
+
+    def _begin_interaction(self):
+        self.setRenderHint(QPainter.Antialiasing, False)
+        self._idle_timer.start()
+
+    def _restore_antialiasing(self):
+        self.setRenderHint(QPainter.Antialiasing, True)
+        self.viewport().update()
 
     def wheelEvent(self, event):
         # Zoom in/out with Ctrl + Wheel
         if event.modifiers() == Qt.ControlModifier:
-            zoom_factor = 1.25
-            if event.angleDelta().y() > 0:
-                self.scale(zoom_factor, zoom_factor)
-            else:
-                self.scale(1.0 / zoom_factor, 1.0 / zoom_factor)
+            self._begin_interaction()
+            self._pending_zoom += ZOOM_STEP if event.angleDelta().y() > 0 else -ZOOM_STEP
+            if not self._zoom_timer.isActive():
+                self._zoom_timer.start()
             event.accept()
         else:
             super().wheelEvent(event)
 
+    def _apply_zoom(self):
+        factor = math.exp(self._pending_zoom)
+        self._pending_zoom = 0.0
+        self.scale(factor, factor)
+        self._sync_scene_transform()
+
     def mousePressEvent(self, event):
         if event.button() == Qt.MiddleButton: # Middle button for panning
             self.setDragMode(QGraphicsView.ScrollHandDrag)
             self._pan_start_mouse_pos = event.pos()
+            self._panning = True
             event.accept()
         else:
             super().mousePressEvent(event)
             
     def mouseMoveEvent(self, event):
         # If panning, update the view manually
-        if self.dragMode() == QGraphicsView.ScrollHandDrag and self._pan_start_mouse_pos is not None:
+        if self._panning:
+            self._begin_interaction()
             delta = event.pos() - self._pan_start_mouse_pos
-            self.horizontalScrollBar().setValue(self.horizontalScrollBar().value() - delta.x())
-            self.verticalScrollBar().setValue(self.verticalScrollBar().value() - delta.y())
+            hbar = self.horizontalScrollBar()
+            vbar = self.verticalScrollBar()
+            viewport = self.viewport()
+            # Move both bars, then repaint once
+            viewport.setUpdatesEnabled(False)
+            hbar.setValue(hbar.value() - delta.x())
+            vbar.setValue(vbar.value() - delta.y())
+            viewport.setUpdatesEnabled(True)
+            viewport.update()
             self._pan_start_mouse_pos = event.pos()
             event.accept()
         else:
@@ -46,10 +112,16 @@ class NodeEditorView(QGraphicsView):
         if event.button() == Qt.MiddleButton: # Stop panning
             self.setDragMode(QGraphicsView.RubberBandDrag)
             self._pan_start_mouse_pos = None
+            self._panning = False
             event.accept()
         else:
             super().mouseReleaseEvent(event)
 
+    def leaveEvent(self, event):
+        # The scene only tracks port hover while the cursor is over it
+        self.scene().set_hover_port(None)
+        super().leaveEvent(event)
+
     def keyPressEvent(self, event):
         # Delete selected edges with Delete or Backspace key
         if event.key() in (Qt.Key_Delete, Qt.Key_Backspace):
@@ -3,13 +3,15 @@ from PySide6.QtWidgets import (
     QGraphicsProxyWidget, QWidget, QVBoxLayout, QHBoxLayout,
     QLabel, QPushButton, QSpinBox, QDoubleSpinBox, QSizePolicy
 )
-from PySide6.QtCore import Qt, QPointF, QRectF, Signal, QSize
+from PySide6.QtCore import Qt, QPointF, QRectF, Signal, Slot, QSize, QTimer
 from PySide6.QtGui import (
     QPainter, QPen, QBrush, QColor, QPainterPath, QFont,
     QPainterPathStroker, QLinearGradient, QRadialGradient, QFontMetrics,
-    QPixmap, QImage
+    QPixmap, QImage, QPixmapCache
 )
+from collections import OrderedDict
 from pathlib import Path
+import math
 import numpy as np
 
 # --- Layout Constants ---
@@ -25,6 +27,16 @@ OUTPUT_NODE_WIDTH = 280
 OUTPUT_NODE_HEIGHT = 220
 OUTPUT_PREVIEW_HEIGHT = 150
 
+# Max number of pre-rendered node chrome pixmaps kept around
+CHROME_CACHE_SIZE = 64
+
+# Node item caches are rendered at this multiple of the node size so nodes
+# stay sharp when zoomed in
+NODE_CACHE_SCALE = 2
+
+# Scaled Output previews live in Qt's global pixmap cache (limit in KB)
+QPixmapCache.setCacheLimit(32 * 1024)
+
 # --- Category Color Palette (Professional Theme) ---
 CATEGORY_COLORS = {
     "Basic I/O": {
@@ -60,16 +72,103 @@ COLOR_PORT = QColor("#9FA8DA")  # Default port color for edge dragging
 COLOR_TEXT = QColor("#E8EAF0")
 COLOR_SHADOW = QColor(0, 0, 0, 50)
 
+EDGE_MAX_CURVE_OFFSET = 100
+# Edges shorter than this are drawn as straight lines
+EDGE_STRAIGHT_LENGTH = 40
+
+# Below this zoom level items paint without antialiasing; the difference is
+# not visible at that size and non-AA rasterization is several times cheaper.
+# Items only ever switch AA off, so the view's own toggle still applies.
+_AA_MIN_LOD = 0.75
+
+
+# Resolved on first paint: this module is imported before the QApplication
+# exists and before main.py registers the bundled Inter font.
+_NODE_TITLE_FONT = None
+_PREVIEW_FONT = None
+
+
+def _resolve_fonts():
+    global _NODE_TITLE_FONT, _PREVIEW_FONT
+    _NODE_TITLE_FONT = QFont("Inter", 10, QFont.DemiBold)
+    if not _NODE_TITLE_FONT.exactMatch():
+        _NODE_TITLE_FONT = QFont("Segoe UI", 10, QFont.DemiBold)
+    _PREVIEW_FONT = QFont("Inter", 9)
+
+
+# Node width -> header path with rounded top corners
+_HEADER_PATH_CACHE = {}
+
+
+def header_path_for_width(width):
+    """Return the (shared) header path for a node of the given width."""
+    path = _HEADER_PATH_CACHE.get(width)
+    if path is None:
+        path = QPainterPath()
+        path.moveTo(0, NODE_HEADER_HEIGHT)
+        path.lineTo(0, 10)
+        path.arcTo(QRectF(0, 0, 20, 20), 180, -90)
+        path.lineTo(width - 10, 0)
+        path.arcTo(QRectF(width - 20, 0, 20, 20), 90, -90)
+        path.lineTo(width, NODE_HEADER_HEIGHT)
+        path.closeSubpath()
+        # Drag-resizing produces many one-off widths; don't let them pile up
+        if len(_HEADER_PATH_CACHE) >= 256:
+            _HEADER_PATH_CACHE.clear()
+        _HEADER_PATH_CACHE[width] = path
+    return path
+
+
+def compute_bezier(x1, y1, x2, y2):
+    """Return the control points (c1x, c1y, c2x, c2y) of a horizontal edge curve."""
+    offset = min(abs(x2 - x1) * 0.5, EDGE_MAX_CURVE_OFFSET)
+    return x1 + offset, y1, x2 - offset, y2
+
+
+def _make_port_style(base_color):
+    """Build the (glow brush, body brush, border pen) for one port color."""
+    glow_gradient = QRadialGradient(0, 0, PORT_SIZE)
+    glow_gradient.setColorAt(0, QColor(base_color.red(), base_color.green(),
+                                       base_color.blue(), 150))
+    glow_gradient.setColorAt(1, QColor(base_color.red(), base_color.green(),
+                                       base_color.blue(), 0))
+
+    port_gradient = QRadialGradient(0, -PORT_SIZE / 4, PORT_SIZE)
+    port_gradient.setColorAt(0, base_color.lighter(130))
+    port_gradient.setColorAt(1, base_color)
+
+    return QBrush(glow_gradient), QBrush(port_gradient), QPen(base_color.darker(120), 1.5)
+
 
 class NodePort(QGraphicsObject):
-    """A modern port widget with glow effect on hover."""
+    """
+    A modern port widget with glow effect on hover.
+
+    Ports don't take Qt hover events; the scene finds the port under the
+    cursor in its port grid and calls set_hovered(). Like the resize grip,
+    the idle port is baked into the node's chrome pixmap, so the item only
+    draws while hovered; it stays a real item for hit tests and edge anchors.
+    """
+
+    _GLOW_RECT = QRectF(-PORT_SIZE / 2 - 3, -PORT_SIZE / 2 - 3, PORT_SIZE + 6, PORT_SIZE + 6)
+    _PORT_RECT = QRectF(-PORT_SIZE / 2, -PORT_SIZE / 2, PORT_SIZE, PORT_SIZE)
+    _HIGHLIGHT_RECT = QRectF(-PORT_SIZE / 4, -PORT_SIZE / 4, PORT_SIZE / 2, PORT_SIZE / 2)
+    _HIGHLIGHT_BRUSH = QBrush(QColor(255, 255, 255, 60))
+    _STYLES = {
+        True: _make_port_style(COLOR_PORT_OUTPUT),
+        False: _make_port_style(COLOR_PORT_INPUT),
+    }
 
     def __init__(self, parent, is_output=False):
         super().__init__(parent)
         self.is_output = is_output
         self.hovered = False
-        self.setAcceptHoverEvents(True)
+        # Peer port -> EdgeWidget for every connection on this port
+        self.outgoing = {}
+        self.incoming = {}
+        self._grid_cell = None  # Bucket in the scene's port grid
         self.setFlag(QGraphicsItem.ItemIsSelectable, False)
+        self.setFlag(QGraphicsItem.ItemSendsScenePositionChanges, True)
         self.setToolTip("Output" if is_output else "Input")
 
     def boundingRect(self):
@@ -78,56 +177,68 @@ class NodePort(QGraphicsObject):
                       PORT_SIZE + 8, PORT_SIZE + 8)
 
     def paint(self, painter, option, widget):
-        painter.setRenderHint(QPainter.Antialiasing)
-
-        base_color = COLOR_PORT_OUTPUT if self.is_output else COLOR_PORT_INPUT
-
-        # Glow effect when hovered
-        if self.hovered:
-            glow_rect = QRectF(-PORT_SIZE / 2 - 3, -PORT_SIZE / 2 - 3,
-                               PORT_SIZE + 6, PORT_SIZE + 6)
-            glow_gradient = QRadialGradient(0, 0, PORT_SIZE)
-            glow_gradient.setColorAt(0, QColor(base_color.red(), base_color.green(),
-                                               base_color.blue(), 150))
-            glow_gradient.setColorAt(1, QColor(base_color.red(), base_color.green(),
-                                               base_color.blue(), 0))
-            painter.setBrush(glow_gradient)
-            painter.setPen(Qt.NoPen)
-            painter.drawEllipse(glow_rect)
+        if not self.hovered:
+            return
+        if option.levelOfDetailFromTransform(painter.worldTransform()) < _AA_MIN_LOD:
+            painter.setRenderHint(QPainter.Antialiasing, False)
 
-        # Main port circle with gradient
-        port_rect = QRectF(-PORT_SIZE / 2, -PORT_SIZE / 2, PORT_SIZE, PORT_SIZE)
+        # Glow effect, then the port again on top of it
+        painter.setBrush(self._STYLES[self.is_output][0])
+        painter.setPen(Qt.NoPen)
+        painter.drawEllipse(self._GLOW_RECT)
+        self.draw_port(painter, self.is_output)
 
-        port_gradient = QRadialGradient(0, -PORT_SIZE / 4, PORT_SIZE)
-        port_gradient.setColorAt(0, base_color.lighter(130))
-        port_gradient.setColorAt(1, base_color)
+    @classmethod
+    def draw_port(cls, painter, is_output):
+        """Draw an idle port centered on the painter's origin."""
+        _, port_brush, port_pen = cls._STYLES[is_output]
 
-        painter.setBrush(port_gradient)
-        painter.setPen(QPen(base_color.darker(120), 1.5))
-        painter.drawEllipse(port_rect)
+        # Main port circle with gradient
+        painter.setBrush(port_brush)
+        painter.setPen(port_pen)
+        painter.drawEllipse(cls._PORT_RECT)
 
         # Inner highlight
-        highlight_rect = QRectF(-PORT_SIZE / 4, -PORT_SIZE / 4,
-                                PORT_SIZE / 2, PORT_SIZE / 2)
-        painter.setBrush(QColor(255, 255, 255, 60))
+        painter.setBrush(cls._HIGHLIGHT_BRUSH)
         painter.setPen(Qt.NoPen)
-        painter.drawEllipse(highlight_rect)
+        painter.drawEllipse(cls._HIGHLIGHT_RECT)
 
-    def hoverEnterEvent(self, event):
-        self.hovered = True
-        self.update()
-        super().hoverEnterEvent(event)
+    def itemChange(self, change, value):
+        if change in (QGraphicsItem.ItemScenePositionHasChanged,
+                      QGraphicsItem.ItemSceneHasChanged) and self.scene():
+            self.scene().update_port_cell(self)
+        return super().itemChange(change, value)
+
+    def set_hovered(self, hovered):
+        if hovered != self.hovered:
+            self.hovered = hovered
+            self.update()
 
-    def hoverLeaveEvent(self, event):
-        self.hovered = False
-        self.update()
-        super().hoverLeaveEvent(event)
+
+def _make_grip_path(size):
+    """Three short diagonals in the bottom-right corner of a size x size box."""
+    path = QPainterPath()
+    for i in range(3):
+        offset = i * 3 + 3
+        path.moveTo(size - offset, size)
+        path.lineTo(size, size - offset)
+    return path
 
 
 class ResizeHandle(QGraphicsItem):
-    """A resize handle at the bottom-right corner of a node."""
+    """
+    A resize handle at the bottom-right corner of a node.
+
+    The idle grip is baked into the node's chrome pixmap, so the handle only
+    draws anything (in the brighter hover color) while the cursor is over it.
+    It must not set ItemHasNoContents: Qt leaves such items out of items() and
+    itemAt(), which would stop the handle receiving hover and mouse events.
+    """
 
     HANDLE_SIZE = 12
+    _PEN_HOVER = QPen(QColor("#888"), 1.5)
+    _PEN_NORMAL = QPen(QColor("#555"), 1.5)
+    _GRIP_PATH = _make_grip_path(HANDLE_SIZE)
 
     def __init__(self, parent):
         super().__init__(parent)
@@ -142,19 +253,14 @@ class ResizeHandle(QGraphicsItem):
         return QRectF(0, 0, self.HANDLE_SIZE, self.HANDLE_SIZE)
 
     def paint(self, painter, option, widget):
-        painter.setRenderHint(QPainter.Antialiasing)
-
-        # Draw resize grip lines
-        color = QColor("#888") if self.hovered else QColor("#555")
-        painter.setPen(QPen(color, 1.5))
-
-        # Draw diagonal lines
-        for i in range(3):
-            offset = i * 3 + 3
-            painter.drawLine(
-                QPointF(self.HANDLE_SIZE - offset, self.HANDLE_SIZE),
-                QPointF(self.HANDLE_SIZE, self.HANDLE_SIZE - offset)
-            )
+        if not self.hovered:
+            return
+        # Draw the highlighted grip over the baked one
+        if option.levelOfDetailFromTransform(painter.worldTransform()) < _AA_MIN_LOD:
+            painter.setRenderHint(QPainter.Antialiasing, False)
+        painter.setPen(self._PEN_HOVER)
+        painter.setBrush(Qt.NoBrush)
+        painter.drawPath(self._GRIP_PATH)
 
     def hoverEnterEvent(self, event):
         self.hovered = True
@@ -198,13 +304,34 @@ class ResizeHandle(QGraphicsItem):
 
 
 class NodeWidget(QGraphicsObject):
-    """A modern node widget with gradient background and category-based colors."""
+    """
+    A modern node widget with gradient background and category-based colors.
+
+    Moving or resizing a node does not rebuild its edges immediately; the
+    node reports itself through scene().schedule_edge_update() and the scene
+    refreshes all affected edges at most once per frame.
+    """
 
     node_selected = Signal(str)
     parameter_changed = Signal(str, str, object)  # node_id, param_name, value
     file_select_requested = Signal(str, str)  # node_id, param_name
     save_requested = Signal(str)  # node_id
 
+    # (width, height, selected, category, name, scale) -> QPixmap, LRU ordered
+    _chrome_cache = OrderedDict()
+    # QFont.key() -> QFontMetrics, shared by every file label
+    _metrics_cache = {}
+
+    _BORDER_PEN = QPen(COLOR_NODE_BORDER, 1)
+    _BORDER_PEN_SELECTED = QPen(COLOR_NODE_BORDER_SELECTED, 2)
+    _ACCENT_PENS = {
+        category: QPen(colors["accent"], 2)
+        for category, colors in CATEGORY_COLORS.items()
+    }
+    _PLACEHOLDER_BRUSH = QBrush(QColor("#1A1A1A"))
+    _PLACEHOLDER_PEN = QPen(QColor("#333"), 1)
+    _PLACEHOLDER_TEXT = QColor("#666")
+
     def __init__(self, node_id, node_name, category="Uncategorized", parameters=None, is_output_node=False):
         super().__init__()
         self.node_id = node_id
@@ -212,8 +339,15 @@ class NodeWidget(QGraphicsObject):
         self.category = category
         self.parameters = parameters or {}
         self.param_widgets = {}
+        # Editor widget / browse button -> parameter name, for the shared slots
+        self._widget_to_name = {}
+        self._btn_to_name = {}
         self.is_output_node = is_output_node
         self.preview_pixmap = None
+        self._preview_generation = 0  # Bumped on every new preview image
+        self._incident_edges = set()
+        # Parameter widgets are built the first time the node is painted
+        self._params_built = False
 
         # Set size based on node type
         if is_output_node:
@@ -231,7 +365,8 @@ class NodeWidget(QGraphicsObject):
             QGraphicsItem.ItemIsSelectable |
             QGraphicsItem.ItemSendsGeometryChanges
         )
-        self.setCacheMode(QGraphicsItem.DeviceCoordinateCache)
+        self._update_geometry()
+        self._update_cache_size()
 
         # Create ports (horizontal layout: input on left, output on right)
         self.input_port = NodePort(self, is_output=False)
@@ -244,25 +379,17 @@ class NodeWidget(QGraphicsObject):
         self.resize_handle = ResizeHandle(self)
         self._update_resize_handle_pos()
 
-        # Create embedded parameter widgets or output preview
+        # Output widgets are needed right away; parameter rows wait until
+        # the node is first painted (see _ensure_parameter_widgets).
         if is_output_node:
             self._setup_output_widgets()
-        else:
-            self._setup_parameter_widgets()
 
     def _setup_output_widgets(self):
         """Setup widgets for Output node: preview area and save button."""
         # Save button at the bottom
         save_btn = QPushButton("Save Image")
         save_btn.setFixedSize(int(self.width - 20), 24)
-        save_btn.setStyleSheet("""
-            QPushButton {
-                background: #2D7D46; border: none;
-                border-radius: 4px; color: #FFF; font-size: 10px; font-weight: bold;
-            }
-            QPushButton:hover { background: #3D8D56; }
-            QPushButton:disabled { background: #555; color: #888; }
-        """)
+        save_btn.setObjectName("saveBtn")
         save_btn.setEnabled(False)
         save_btn.clicked.connect(lambda: self.save_requested.emit(self.node_id))
 
@@ -276,19 +403,56 @@ class NodeWidget(QGraphicsObject):
         if not self.is_output_node or np_image is None:
             return
 
-        h, w = np_image.shape[:2]
-        bytes_per_line = w * (1 if len(np_image.shape) == 2 else 3)
-        fmt = QImage.Format_Grayscale8 if len(np_image.shape) == 2 else QImage.Format_RGB888
-
-        # Make a copy of the image data to ensure it persists
-        img_copy = np_image.copy()
-        q_image = QImage(img_copy.data, w, h, bytes_per_line, fmt)
+        # Normalize to contiguous uint8 gray/RGB; a no-op for the usual output
+        img = np_image
+        if img.dtype != np.uint8:
+            img = np.clip(img, 0, 255).astype(np.uint8)
+        if img.ndim == 3 and img.shape[2] == 1:
+            img = img[..., 0]
+        elif img.ndim == 3 and img.shape[2] == 4:
+            img = img[..., :3]
+
+        # Wrap the array without copying, then detach once with QImage.copy();
+        # fromImage() may share the image data when no conversion is needed.
+        img = np.ascontiguousarray(img)
+        h, w = img.shape[:2]
+        fmt = QImage.Format_Grayscale8 if img.ndim == 2 else QImage.Format_RGB888
+        q_image = QImage(img.data, w, h, img.strides[0], fmt)
         self.preview_pixmap = QPixmap.fromImage(q_image.copy())
+        self._preview_generation += 1
 
         # Enable save button
         self.save_button.setEnabled(True)
         self.update()
 
+    def _update_geometry(self):
+        """Recompute the rects and gradients that depend on the node size."""
+        w, h = self.width, self.height
+        # Room for the shadow and for the ports baked into the chrome
+        self._bounding_rect = QRectF(-PORT_SIZE / 2 - 2, -2, w + PORT_SIZE + 4, h + 8)
+        self._shadow_rect = QRectF(3, 3, w, h)
+        self._body_rect = QRectF(0, 0, w, h)
+        self._body_gradient = QLinearGradient(0, 0, 0, h)
+        self._body_gradient.setColorAt(0, COLOR_NODE_BODY)
+        self._body_gradient.setColorAt(1, COLOR_NODE_BODY_GRADIENT)
+        colors = CATEGORY_COLORS.get(self.category, CATEGORY_COLORS["Uncategorized"])
+        self._header_gradient = QLinearGradient(0, 0, 0, NODE_HEADER_HEIGHT)
+        self._header_gradient.setColorAt(0, colors["header"])
+        self._header_gradient.setColorAt(1, colors["header_gradient"])
+        self._text_rect = QRectF(8, 0, w - 16, NODE_HEADER_HEIGHT)
+        self._dot_rect = QRectF(w - 14, 8, 6, 6)
+        self._header_path = header_path_for_width(w)
+        self._preview_rect = QRectF(10, NODE_HEADER_HEIGHT + 8, w - 20, OUTPUT_PREVIEW_HEIGHT)
+
+    def _update_cache_size(self):
+        """Cache the node in item coordinates so zooming reuses the same raster."""
+        rect = self.boundingRect()
+        self.setCacheMode(
+            QGraphicsItem.ItemCoordinateCache,
+            QSize(math.ceil(rect.width() * NODE_CACHE_SCALE),
+                  math.ceil(rect.height() * NODE_CACHE_SCALE))
+        )
+
     def _update_resize_handle_pos(self):
         """Update resize handle position to bottom-right corner."""
         self.resize_handle.setPos(
@@ -308,12 +472,21 @@ class NodeWidget(QGraphicsObject):
         # Update resize handle position
         self._update_resize_handle_pos()
 
+        self._update_geometry()
+        self._update_cache_size()
         self.update()
 
     def set_size(self, width, height):
         """Set the node size (alias for resize, used when loading workflows)."""
         self.resize(width, height)
 
+    def _ensure_parameter_widgets(self):
+        """Build the parameter widgets if that hasn't happened yet."""
+        if self._params_built:
+            return
+        self._params_built = True
+        self._setup_parameter_widgets()
+
     def _setup_parameter_widgets(self):
         """Create embedded widgets for each parameter."""
         if not self.parameters:
@@ -323,14 +496,14 @@ class NodeWidget(QGraphicsObject):
 
         for name, props in self.parameters.items():
             container = QWidget()
-            container.setStyleSheet("background: transparent;")
+            container.setObjectName("paramRow")
             layout = QHBoxLayout(container)
             layout.setContentsMargins(4, 0, 4, 0)
             layout.setSpacing(4)
 
             # Label
             label = QLabel(name[:8] + ":" if len(name) > 8 else name + ":")
-            label.setStyleSheet("color: #AAA; font-size: 9px; background: transparent;")
+            label.setObjectName("paramLabel")
             label.setFixedWidth(50)
             layout.addWidget(label)
 
@@ -356,55 +529,43 @@ class NodeWidget(QGraphicsObject):
         if param_type == 'int':
             widget = QSpinBox()
             widget.setFixedHeight(20)
-            widget.setStyleSheet("""
-                QSpinBox {
-                    background: #3A3A3A; border: 1px solid #555;
-                    border-radius: 3px; color: #DDD; font-size: 9px;
-                }
-            """)
+            widget.setObjectName("paramSpin")
             if 'range' in props:
                 widget.setRange(*props['range'])
             if 'step' in props:
                 widget.setSingleStep(props['step'])
             widget.setValue(value if value is not None else 0)
-            widget.valueChanged.connect(
-                lambda v, n=name: self.parameter_changed.emit(self.node_id, n, v)
-            )
+            self._widget_to_name[widget] = name
+            widget.valueChanged.connect(self._on_int_param_changed)
             return widget
 
         elif param_type == 'float':
             widget = QDoubleSpinBox()
             widget.setFixedHeight(20)
-            widget.setStyleSheet("""
-                QDoubleSpinBox {
-                    background: #3A3A3A; border: 1px solid #555;
-                    border-radius: 3px; color: #DDD; font-size: 9px;
-                }
-            """)
+            widget.setObjectName("paramDoubleSpin")
             if 'range' in props:
                 widget.setRange(*props['range'])
             if 'step' in props:
                 widget.setSingleStep(props['step'])
             widget.setValue(value if value is not None else 0.0)
-            widget.valueChanged.connect(
-                lambda v, n=name: self.parameter_changed.emit(self.node_id, n, v)
-            )
+            self._widget_to_name[widget] = name
+            widget.valueChanged.connect(self._on_float_param_changed)
             return widget
 
         elif param_type == 'filepath':
             container = QWidget()
-            container.setStyleSheet("background: transparent;")
+            container.setObjectName("paramRow")
             h_layout = QHBoxLayout(container)
             h_layout.setContentsMargins(0, 0, 0, 0)
             h_layout.setSpacing(2)
 
             # File name label (elided)
             file_label = QLabel()
-            file_label.setStyleSheet("color: #8CF; font-size: 9px; background: transparent;")
+            file_label.setObjectName("fileLabel")
             if value:
                 filename = Path(value).name
                 # Elide if too long
-                metrics = QFontMetrics(file_label.font())
+                metrics = self._get_metrics(file_label.font())
                 elided = metrics.elidedText(filename, Qt.ElideMiddle, 70)
                 file_label.setText(elided)
                 file_label.setToolTip(str(value))
@@ -415,14 +576,9 @@ class NodeWidget(QGraphicsObject):
             # Browse button
             btn = QPushButton("...")
             btn.setFixedSize(24, 18)
-            btn.setStyleSheet("""
-                QPushButton {
-                    background: #4A4A4A; border: 1px solid #555;
-                    border-radius: 3px; color: #DDD; font-size: 9px;
-                }
-                QPushButton:hover { background: #5A5A5A; }
-            """)
-            btn.clicked.connect(lambda _, n=name: self.file_select_requested.emit(self.node_id, n))
+            btn.setObjectName("fileBtn")
+            self._btn_to_name[btn] = name
+            btn.clicked.connect(self._on_browse_clicked)
             h_layout.addWidget(btn)
 
             # Store reference to update later
@@ -431,6 +587,30 @@ class NodeWidget(QGraphicsObject):
 
         return None
 
+    @Slot(int)
+    def _on_int_param_changed(self, value):
+        name = self._widget_to_name[self.sender()]
+        self.parameter_changed.emit(self.node_id, name, value)
+
+    @Slot(float)
+    def _on_float_param_changed(self, value):
+        name = self._widget_to_name[self.sender()]
+        self.parameter_changed.emit(self.node_id, name, value)
+
+    @Slot()
+    def _on_browse_clicked(self):
+        name = self._btn_to_name[self.sender()]
+        self.file_select_requested.emit(self.node_id, name)
+
+    @classmethod
+    def _get_metrics(cls, font):
+        """Return a QFontMetrics for the font, reusing one per distinct font."""
+        key = font.key()
+        metrics = cls._metrics_cache.get(key)
+        if metrics is None:
+            metrics = cls._metrics_cache[key] = QFontMetrics(font)
+        return metrics
+
     def update_filepath_display(self, param_name, filepath):
         """Update the displayed filename after file selection."""
         label_key = param_name + "_label"
@@ -438,7 +618,7 @@ class NodeWidget(QGraphicsObject):
             label = self.param_widgets[label_key]
             if filepath:
                 filename = Path(filepath).name
-                metrics = QFontMetrics(label.font())
+                metrics = self._get_metrics(label.font())
                 elided = metrics.elidedText(filename, Qt.ElideMiddle, 70)
                 label.setText(elided)
                 label.setToolTip(str(filepath))
@@ -451,108 +631,147 @@ class NodeWidget(QGraphicsObject):
         self.input_port.setPos(0, self.height / 2)
         self.output_port.setPos(self.width, self.height / 2)
         if self.scene():
-            self.scene().update_edges_for_node(self)
+            self.scene().schedule_edge_update(self)
 
     def boundingRect(self):
-        # Include space for shadow
-        return QRectF(-2, -2, self.width + 8, self.height + 8)
+        # Include space for shadow and ports
+        return self._bounding_rect
+
+    def _chrome_pixmap(self, scale):
+        """Return the static node body/header rendered at the given scale."""
+        key = (int(self.width), int(self.height), self.isSelected(),
+               self.category, self.node_name, scale)
+        cache = NodeWidget._chrome_cache
+        pixmap = cache.get(key)
+        if pixmap is not None:
+            cache.move_to_end(key)
+            return pixmap
+
+        rect = self.boundingRect()
+        pixmap = QPixmap(math.ceil(rect.width() * scale), math.ceil(rect.height() * scale))
+        pixmap.fill(Qt.transparent)
+        pix_painter = QPainter(pixmap)
+        pix_painter.setRenderHint(QPainter.Antialiasing)
+        pix_painter.scale(scale, scale)
+        pix_painter.translate(-rect.x(), -rect.y())
+        self._paint_chrome(pix_painter)
+        pix_painter.end()
+
+        cache[key] = pixmap
+        if len(cache) > CHROME_CACHE_SIZE:
+            cache.popitem(last=False)
+        return pixmap
 
     def paint(self, painter, option, widget):
-        painter.setRenderHint(QPainter.Antialiasing)
+        pixmap = self._chrome_pixmap(NODE_CACHE_SCALE)
+        painter.drawPixmap(self.boundingRect(), pixmap, QRectF(pixmap.rect()))
 
+        # Draw preview image for Output node
+        if self.is_output_node:
+            self._paint_preview(painter)
+        elif not self._params_built and self.parameters:
+            # Adding child items from inside paint() is not allowed, so
+            # build the widgets once control returns to the event loop.
+            QTimer.singleShot(0, self._ensure_parameter_widgets)
+
+    def _paint_chrome(self, painter):
+        """Draw shadow, body, header, title, category dot, idle grip and ports."""
         colors = CATEGORY_COLORS.get(self.category, CATEGORY_COLORS["Uncategorized"])
+        accent_pen = self._ACCENT_PENS.get(self.category, self._ACCENT_PENS["Uncategorized"])
 
         # 1. Draw shadow
-        shadow_rect = QRectF(3, 3, self.width, self.height)
         painter.setBrush(COLOR_SHADOW)
         painter.setPen(Qt.NoPen)
-        painter.drawRoundedRect(shadow_rect, 10, 10)
+        painter.drawRoundedRect(self._shadow_rect, 10, 10)
 
         # 2. Draw main body with gradient
-        body_rect = QRectF(0, 0, self.width, self.height)
-        body_gradient = QLinearGradient(0, 0, 0, self.height)
-        body_gradient.setColorAt(0, COLOR_NODE_BODY)
-        body_gradient.setColorAt(1, COLOR_NODE_BODY_GRADIENT)
-        painter.setBrush(body_gradient)
+        painter.setBrush(self._body_gradient)
 
-        border_color = COLOR_NODE_BORDER_SELECTED if self.isSelected() else COLOR_NODE_BORDER
-        border_width = 2 if self.isSelected() else 1
-        painter.setPen(QPen(border_color, border_width))
-        painter.drawRoundedRect(body_rect, 10, 10)
+        painter.setPen(self._BORDER_PEN_SELECTED if self.isSelected() else self._BORDER_PEN)
+        painter.drawRoundedRect(self._body_rect, 10, 10)
 
         # 3. Draw header with gradient
-        header_rect = QRectF(0, 0, self.width, NODE_HEADER_HEIGHT)
-        header_gradient = QLinearGradient(0, 0, 0, NODE_HEADER_HEIGHT)
-        header_gradient.setColorAt(0, colors["header"])
-        header_gradient.setColorAt(1, colors["header_gradient"])
-
-        # Create header path with rounded top corners only
-        header_path = QPainterPath()
-        header_path.moveTo(0, NODE_HEADER_HEIGHT)
-        header_path.lineTo(0, 10)
-        header_path.arcTo(QRectF(0, 0, 20, 20), 180, -90)
-        header_path.lineTo(self.width - 10, 0)
-        header_path.arcTo(QRectF(self.width - 20, 0, 20, 20), 90, -90)
-        header_path.lineTo(self.width, NODE_HEADER_HEIGHT)
-        header_path.closeSubpath()
-
-        painter.setBrush(header_gradient)
+        painter.setBrush(self._header_gradient)
         painter.setPen(Qt.NoPen)
-        painter.drawPath(header_path)
+        painter.drawPath(self._header_path)
 
         # 4. Draw accent line under header
-        painter.setPen(QPen(colors["accent"], 2))
+        painter.setPen(accent_pen)
         painter.drawLine(
             QPointF(0, NODE_HEADER_HEIGHT),
             QPointF(self.width, NODE_HEADER_HEIGHT)
         )
 
         # 5. Draw node name
-        font = QFont("Inter", 10, QFont.DemiBold)
-        if not font.exactMatch():
-            font = QFont("Segoe UI", 10, QFont.DemiBold)
-        painter.setFont(font)
+        if _NODE_TITLE_FONT is None:
+            _resolve_fonts()
+        painter.setFont(_NODE_TITLE_FONT)
         painter.setPen(COLOR_TEXT)
 
-        text_rect = QRectF(8, 0, self.width - 16, NODE_HEADER_HEIGHT)
-        painter.drawText(text_rect, Qt.AlignVCenter | Qt.AlignLeft, self.node_name)
+        painter.drawText(self._text_rect, Qt.AlignVCenter | Qt.AlignLeft, self.node_name)
 
         # 6. Draw category indicator (small colored dot)
-        dot_rect = QRectF(self.width - 14, 8, 6, 6)
         painter.setBrush(colors["accent"])
         painter.setPen(Qt.NoPen)
-        painter.drawEllipse(dot_rect)
+        painter.drawEllipse(self._dot_rect)
 
-        # 7. Draw preview image for Output node
-        if self.is_output_node:
-            preview_rect = QRectF(10, NODE_HEADER_HEIGHT + 8, self.width - 20, OUTPUT_PREVIEW_HEIGHT)
-
-            if self.preview_pixmap:
-                # Draw the scaled preview image
-                scaled_pixmap = self.preview_pixmap.scaled(
-                    int(preview_rect.width()), int(preview_rect.height()),
-                    Qt.KeepAspectRatio, Qt.SmoothTransformation
-                )
-                # Center the image in the preview area
-                x_offset = (preview_rect.width() - scaled_pixmap.width()) / 2
-                y_offset = (preview_rect.height() - scaled_pixmap.height()) / 2
-                painter.drawPixmap(
-                    int(preview_rect.x() + x_offset),
-                    int(preview_rect.y() + y_offset),
-                    scaled_pixmap
+        # 7. Draw the idle resize grip (ResizeHandle only paints when hovered)
+        painter.translate(self.width - ResizeHandle.HANDLE_SIZE,
+                          self.height - ResizeHandle.HANDLE_SIZE)
+        painter.setPen(ResizeHandle._PEN_NORMAL)
+        painter.setBrush(Qt.NoBrush)
+        painter.drawPath(ResizeHandle._GRIP_PATH)
+        painter.translate(-(self.width - ResizeHandle.HANDLE_SIZE),
+                          -(self.height - ResizeHandle.HANDLE_SIZE))
+
+        # 8. Draw the idle ports (NodePort only paints when hovered)
+        for x, is_output in ((0, False), (self.width, True)):
+            painter.translate(x, self.height / 2)
+            NodePort.draw_port(painter, is_output)
+            painter.translate(-x, -self.height / 2)
+
+    def _paint_preview(self, painter):
+        """Draw the Output node's preview image or placeholder."""
+        preview_rect = self._preview_rect
+
+        if self.preview_pixmap:
+            # Smooth scaling is expensive; redo it only when the source or size changes
+            pw, ph = int(preview_rect.width()), int(preview_rect.height())
+            key = f"preview:{self.node_id}:{self._preview_generation}:{pw}x{ph}"
+            scaled_pixmap = QPixmapCache.find(key)
+            if scaled_pixmap is None or scaled_pixmap.isNull():
+                source = self.preview_pixmap
+                if source.width() > 4 * pw or source.height() > 4 * ph:
+                    # Big reductions: cheap nearest pass down to 2x, then smooth
+                    source = source.scaled(
+                        2 * pw, 2 * ph, Qt.KeepAspectRatio, Qt.FastTransformation
+                    )
+                scaled_pixmap = source.scaled(
+                    pw, ph, Qt.KeepAspectRatio, Qt.SmoothTransformation
                 )
-            else:
-                # Draw placeholder
-                painter.setBrush(QColor("#1A1A1A"))
-                painter.setPen(QPen(QColor("#333"), 1))
-                painter.drawRoundedRect(preview_rect, 6, 6)
-                painter.setPen(QColor("#666"))
-                painter.setFont(QFont("Inter", 9))
-                painter.drawText(preview_rect, Qt.AlignCenter, "No Preview\nRun to see output")
+                QPixmapCache.insert(key, scaled_pixmap)
+            # Center the image in the preview area
+            x_offset = (preview_rect.width() - scaled_pixmap.width()) / 2
+            y_offset = (preview_rect.height() - scaled_pixmap.height()) / 2
+            painter.drawPixmap(
+                int(preview_rect.x() + x_offset),
+                int(preview_rect.y() + y_offset),
+                scaled_pixmap
+            )
+        else:
+            # Draw placeholder
+            painter.setBrush(self._PLACEHOLDER_BRUSH)
+            painter.setPen(self._PLACEHOLDER_PEN)
+            painter.drawRoundedRect(preview_rect, 6, 6)
+            painter.setPen(self._PLACEHOLDER_TEXT)
+            if _PREVIEW_FONT is None:
+                _resolve_fonts()
+            painter.setFont(_PREVIEW_FONT)
+            painter.drawText(preview_rect, Qt.AlignCenter, "No Preview\nRun to see output")
 
     def itemChange(self, change, value):
         if change == QGraphicsItem.ItemPositionHasChanged and self.scene():
-            self.scene().update_edges_for_node(self)
+            self.scene().schedule_edge_update(self)
         return super().itemChange(change, value)
 
     def mousePressEvent(self, event: QGraphicsSceneMouseEvent):
@@ -560,21 +779,74 @@ class NodeWidget(QGraphicsObject):
         super().mousePressEvent(event)
 
 
+def _round_cap_pen(color, width):
+    pen = QPen(color, width)
+    pen.setCapStyle(Qt.RoundCap)
+    return pen
+
+
 class EdgeWidget(QGraphicsObject):
     """A modern edge widget with gradient color from output to input."""
 
-    def __init__(self, start_port, end_port):
+    _SELECT_PEN = _round_cap_pen(QColor("#FFB300"), 4)
+    _HOVER_PEN = _round_cap_pen(QColor(255, 255, 255, 80), 4)
+    _SHADOW_PEN = _round_cap_pen(QColor(0, 0, 0, 30), 5)
+    # Zoomed-out edges: 1px cosmetic line in the gradient's midpoint color
+    _LOD_PEN = QPen(QColor(
+        (COLOR_PORT_OUTPUT.red() + COLOR_PORT_INPUT.red()) // 2,
+        (COLOR_PORT_OUTPUT.green() + COLOR_PORT_INPUT.green()) // 2,
+        (COLOR_PORT_OUTPUT.blue() + COLOR_PORT_INPUT.blue()) // 2,
+    ), 1)
+    _LOD_PEN.setCosmetic(True)
+    _LOD_SELECT_PEN = QPen(QColor("#FFB300"), 1)
+    _LOD_SELECT_PEN.setCosmetic(True)
+    # Builds the 12px hit-test shape; shared by every edge
+    _STROKER = QPainterPathStroker()
+    _STROKER.setWidth(12)
+
+    def __init__(self, start_port, end_port, build_path=True):
         super().__init__()
         self.start_port = start_port
         self.end_port = end_port
         self.setZValue(-1)
 
+        # Register with both ports and nodes so lookups never scan the scene
+        start_port.outgoing[end_port] = self
+        end_port.incoming[start_port] = self
+        start_port.parentItem()._incident_edges.add(self)
+        end_port.parentItem()._incident_edges.add(self)
+
         # Make edge selectable
         self.setFlag(QGraphicsItem.ItemIsSelectable, True)
+        # Needed for option.exposedRect to be the actual exposed area in paint()
+        self.setFlag(QGraphicsItem.ItemUsesExtendedStyleOption, True)
         self.setAcceptHoverEvents(True)
         self.hovered = False
 
-        self.update_path()
+        # Batch constructors pass build_path=False and call rebuild_many()
+        # before adding the edges to a scene.
+        if build_path:
+            self.update_path()
+
+    @classmethod
+    def rebuild_many(cls, edges):
+        """Rebuild the paths of several edges, looking up each port position once."""
+        positions = {}
+        for edge in edges:
+            p1 = positions.get(edge.start_port)
+            if p1 is None:
+                p1 = positions[edge.start_port] = edge.start_port.scenePos()
+            p2 = positions.get(edge.end_port)
+            if p2 is None:
+                p2 = positions[edge.end_port] = edge.end_port.scenePos()
+            edge.update_path(p1, p2)
+
+    def detach(self):
+        """Unregister this edge from its ports and nodes."""
+        self.start_port.outgoing.pop(self.end_port, None)
+        self.end_port.incoming.pop(self.start_port, None)
+        self.start_port.parentItem()._incident_edges.discard(self)
+        self.end_port.parentItem()._incident_edges.discard(self)
 
     def hoverEnterEvent(self, event):
         self.hovered = True
@@ -586,66 +858,94 @@ class EdgeWidget(QGraphicsObject):
         self.update()
         super().hoverLeaveEvent(event)
 
-    def update_path(self):
+    def update_path(self, p1=None, p2=None):
+        """Rebuild the curve; callers may pass endpoints they already know."""
         self.prepareGeometryChange()
-        p1 = self.start_port.scenePos()
-        p2 = self.end_port.scenePos()
-
-        path = QPainterPath(p1)
-
-        # Horizontal Bezier curve calculation
-        dx = abs(p2.x() - p1.x())
-        offset = min(dx * 0.5, 100)
-
-        ctrl1 = QPointF(p1.x() + offset, p1.y())
-        ctrl2 = QPointF(p2.x() - offset, p2.y())
-        path.cubicTo(ctrl1, ctrl2, p2)
+        if p1 is None:
+            p1 = self.start_port.scenePos()
+        if p2 is None:
+            p2 = self.end_port.scenePos()
+        x1, y1 = p1.x(), p1.y()
+        x2, y2 = p2.x(), p2.y()
+
+        path = QPainterPath()
+        path.moveTo(x1, y1)
+        dx, dy = x2 - x1, y2 - y1
+        if math.hypot(dx, dy) < EDGE_STRAIGHT_LENGTH or (dx >= 0 and abs(dy) < 1):
+            # Short or level forward edges: the curve would look straight anyway
+            path.lineTo(x2, y2)
+        else:
+            path.cubicTo(*compute_bezier(x1, y1, x2, y2), x2, y2)
 
         self.path = path
+        self._p1 = p1
+        self._p2 = p2
+        self._edge_pen = None  # Gradient follows the endpoints; rebuilt on next paint
+        # Hit tests call shape() and boundingRect() on every mouse move;
+        # compute both only when the path changes
+        self._shape = self._STROKER.createStroke(path)
+        self._path_rect = path.boundingRect()
+        # Half the hit stroke width also covers every pen drawn in paint()
+        self._bounding_rect = self._path_rect.adjusted(-6, -6, 6, 6)
 
     def boundingRect(self):
-        return self.path.boundingRect().adjusted(-5, -5, 5, 5)
+        return self._bounding_rect
 
     def shape(self):
-        stroker = QPainterPathStroker()
-        stroker.setWidth(12)
-        return stroker.createStroke(self.path)
+        return self._shape
 
     def paint(self, painter, option, widget):
-        painter.setRenderHint(QPainter.Antialiasing)
+        path_rect = self._path_rect
+        if not option.exposedRect.intersects(self._bounding_rect):
+            return
 
-        p1 = self.start_port.scenePos()
-        p2 = self.end_port.scenePos()
+        p1 = self._p1
+        p2 = self._p2
+
+        # The view does not save painter state between items; never fill
+        painter.setBrush(Qt.NoBrush)
+
+        lod = option.levelOfDetailFromTransform(painter.worldTransform())
+        if lod < _AA_MIN_LOD:
+            painter.setRenderHint(QPainter.Antialiasing, False)
+        if path_rect.width() * lod < 1 and path_rect.height() * lod < 1:
+            # Sub-pixel on screen: a plain line is indistinguishable
+            painter.setPen(COLOR_PORT_OUTPUT)
+            painter.drawLine(p1, p2)
+            return
+
+        if lod < 0.4:
+            # Too small for highlight, shadow or gradient to be visible
+            painter.setPen(self._LOD_SELECT_PEN if self.isSelected() else self._LOD_PEN)
+            painter.drawPath(self.path)
+            return
 
         # Draw selection/hover highlight
         if self.isSelected():
-            highlight_pen = QPen(QColor("#FFB300"), 4)
-            highlight_pen.setCapStyle(Qt.RoundCap)
-            painter.setPen(highlight_pen)
+            painter.setPen(self._SELECT_PEN)
             painter.drawPath(self.path)
         elif self.hovered:
-            highlight_pen = QPen(QColor(255, 255, 255, 80), 4)
-            highlight_pen.setCapStyle(Qt.RoundCap)
-            painter.setPen(highlight_pen)
+            painter.setPen(self._HOVER_PEN)
             painter.drawPath(self.path)
 
-        # Draw shadow
-        shadow_pen = QPen(QColor(0, 0, 0, 30), 5)
-        shadow_pen.setCapStyle(Qt.RoundCap)
-        shadow_path = QPainterPath(self.path)
-        shadow_path.translate(1.5, 1.5)
-        painter.setPen(shadow_pen)
-        painter.drawPath(shadow_path)
+        # Draw shadow (invisible when zoomed far out)
+        if lod > 0.5:
+            painter.setPen(self._SHADOW_PEN)
+            painter.translate(1.5, 1.5)
+            painter.drawPath(self.path)
+            painter.translate(-1.5, -1.5)
 
         # Draw gradient edge (output color to input color)
-        edge_gradient = QLinearGradient(p1, p2)
-        edge_gradient.setColorAt(0, COLOR_PORT_OUTPUT)
-        edge_gradient.setColorAt(1, COLOR_PORT_INPUT)
+        edge_pen = self._edge_pen
+        if edge_pen is None:
+            edge_gradient = QLinearGradient(p1, p2)
+            edge_gradient.setColorAt(0, COLOR_PORT_OUTPUT)
+            edge_gradient.setColorAt(1, COLOR_PORT_INPUT)
 
-        edge_pen = QPen(QBrush(edge_gradient), 2.5)
-        edge_pen.setCapStyle(Qt.RoundCap)
-        edge_pen.setJoinStyle(Qt.RoundJoin)
+            edge_pen = QPen(QBrush(edge_gradient), 2.5)
+            edge_pen.setCapStyle(Qt.RoundCap)
+            edge_pen.setJoinStyle(Qt.RoundJoin)
+            self._edge_pen = edge_pen
 
         painter.setPen(edge_pen)
-        painter.setBrush(Qt.NoBrush)
         painter.drawPath(self.path)
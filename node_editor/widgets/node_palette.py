@@ -1,13 +1,18 @@
 from PySide6.QtWidgets import (
-    QWidget, QVBoxLayout, QLineEdit, QTreeWidget, QTreeWidgetItem,
-    QAbstractItemView
+    QWidget, QVBoxLayout, QLineEdit, QTreeView, QAbstractItemView
 )
-from PySide6.QtCore import Qt, Signal
-from PySide6.QtGui import QIcon
+from PySide6.QtCore import Qt, Signal, QSortFilterProxyModel
+from PySide6.QtGui import QIcon, QStandardItemModel, QStandardItem
 
 
 class NodePalette(QWidget):
-    """A searchable, categorized node palette widget."""
+    """
+    A searchable, categorized node palette widget.
+
+    Nodes live in a QStandardItemModel behind a QSortFilterProxyModel that
+    matches the search text against node names (Qt.UserRole) only, so a
+    category is shown exactly when one of its nodes matches.
+    """
 
     node_double_clicked = Signal(str)  # Emits node name
 
@@ -21,7 +26,7 @@ class NodePalette(QWidget):
     def __init__(self, node_categories, parent=None):
         super().__init__(parent)
         self.node_categories = node_categories
-        self.all_items = []  # Store references for search
+        self._filter_text = ""  # Last search applied to the proxy
         self._setup_ui()
 
     def _setup_ui(self):
@@ -36,13 +41,23 @@ class NodePalette(QWidget):
         self.search_box.textChanged.connect(self._filter_nodes)
         layout.addWidget(self.search_box)
 
-        # Tree widget
-        self.tree = QTreeWidget()
+        # Model and filter
+        self.model = QStandardItemModel(self)
+        self.proxy = QSortFilterProxyModel(self)
+        self.proxy.setSourceModel(self.model)
+        self.proxy.setRecursiveFilteringEnabled(True)
+        self.proxy.setFilterCaseSensitivity(Qt.CaseInsensitive)
+        self.proxy.setFilterRole(Qt.UserRole)
+
+        # Tree view
+        self.tree = QTreeView()
+        self.tree.setModel(self.proxy)
         self.tree.setHeaderHidden(True)
         self.tree.setAnimated(True)
         self.tree.setIndentation(16)
         self.tree.setSelectionMode(QAbstractItemView.SingleSelection)
-        self.tree.itemDoubleClicked.connect(self._on_item_double_clicked)
+        self.tree.setEditTriggers(QAbstractItemView.NoEditTriggers)
+        self.tree.doubleClicked.connect(self._on_item_double_clicked)
         self.tree.setExpandsOnDoubleClick(False)
         layout.addWidget(self.tree)
 
@@ -50,75 +65,43 @@ class NodePalette(QWidget):
 
     def _populate_tree(self):
         """Populate the tree with categorized nodes."""
-        self.tree.clear()
-        self.all_items = []
-        self.category_items = {}
+        self.model.clear()
 
-        # Add categories in defined order
-        for category_name, icon_path in self.CATEGORY_ORDER:
-            if category_name not in self.node_categories:
-                continue
+        # Defined categories first, then any uncategorized ones
+        icons = dict(self.CATEGORY_ORDER)
+        ordered = [c for c, _ in self.CATEGORY_ORDER if c in self.node_categories]
+        remaining = set(self.node_categories.keys()) - set(icons)
 
-            category_item = QTreeWidgetItem([category_name])
-            category_item.setIcon(0, QIcon(icon_path))
-            category_item.setFlags(category_item.flags() & ~Qt.ItemIsSelectable)
-            category_item.setExpanded(True)
+        for category_name in ordered + list(remaining):
+            category_item = QStandardItem(category_name)
+            if category_name in icons:
+                category_item.setIcon(QIcon(icons[category_name]))
+            category_item.setSelectable(False)
 
             # Add nodes under this category
             for node_name in sorted(self.node_categories[category_name]):
-                node_item = QTreeWidgetItem([node_name])
-                node_item.setData(0, Qt.UserRole, node_name)
-                category_item.addChild(node_item)
-                self.all_items.append((node_item, node_name.lower(), category_item))
-
-            self.tree.addTopLevelItem(category_item)
-            self.category_items[category_name] = category_item
-
-        # Add any uncategorized nodes
-        remaining = set(self.node_categories.keys()) - {c[0] for c in self.CATEGORY_ORDER}
-        for category_name in remaining:
-            category_item = QTreeWidgetItem([category_name])
-            category_item.setFlags(category_item.flags() & ~Qt.ItemIsSelectable)
-            category_item.setExpanded(True)
+                node_item = QStandardItem(node_name)
+                node_item.setData(node_name, Qt.UserRole)
+                category_item.appendRow(node_item)
 
-            for node_name in sorted(self.node_categories[category_name]):
-                node_item = QTreeWidgetItem([node_name])
-                node_item.setData(0, Qt.UserRole, node_name)
-                category_item.addChild(node_item)
-                self.all_items.append((node_item, node_name.lower(), category_item))
+            self.model.appendRow(category_item)
 
-            self.tree.addTopLevelItem(category_item)
-            self.category_items[category_name] = category_item
+        self.tree.expandAll()
 
     def _filter_nodes(self, text):
         """Filter nodes based on search text."""
-        search_text = text.lower().strip()
-
-        if not search_text:
-            # Show all items
-            for item, _, category in self.all_items:
-                item.setHidden(False)
-            for cat_item in self.category_items.values():
-                cat_item.setHidden(False)
-                cat_item.setExpanded(True)
+        search_text = text.strip()
+        # Edits that only change surrounding whitespace don't change the result
+        if search_text == self._filter_text:
             return
+        self._filter_text = search_text
+        self.proxy.setFilterFixedString(search_text)
+        # Rows the proxy brings back come in collapsed
+        self.tree.expandAll()
 
-        # Hide non-matching items
-        visible_categories = set()
-        for item, name, category in self.all_items:
-            matches = search_text in name
-            item.setHidden(not matches)
-            if matches:
-                visible_categories.add(category)
-                category.setExpanded(True)
-
-        # Hide empty categories
-        for cat_item in self.category_items.values():
-            cat_item.setHidden(cat_item not in visible_categories)
-
-    def _on_item_double_clicked(self, item, column):
+    def _on_item_double_clicked(self, index):
         """Handle node item double-click."""
-        node_name = item.data(0, Qt.UserRole)
+        node_name = index.data(Qt.UserRole)
         if node_name:  # Not a category header
             self.node_double_clicked.emit(node_name)
 
@@ -4,12 +4,38 @@ Preview Gallery Widget - A scrollable gallery of processed image previews.
 from PySide6.QtWidgets import (
     QWidget, QScrollArea, QGridLayout, QLabel, QVBoxLayout, QFrame
 )
-from PySide6.QtCore import Qt, Signal
-from PySide6.QtGui import QPixmap, QImage
+from PySide6.QtCore import Qt, Signal, QObject, QRunnable, QThreadPool
+from PySide6.QtGui import QPixmap, QImage, QColor
 import numpy as np
 from pathlib import Path
 
 
+class _ThumbnailSignals(QObject):
+    """Carries a decoded thumbnail from the pool thread back to the GUI."""
+
+    ready = Signal(int, QImage)  # task id, image
+
+
+class ThumbnailDecodeTask(QRunnable):
+    """Decode and downscale an image file off the GUI thread."""
+
+    def __init__(self, filepath, size, task_id):
+        super().__init__()
+        self.filepath = filepath
+        self.size = size
+        self.task_id = task_id
+        self.signals = _ThumbnailSignals()
+
+    def run(self):
+        # QImage (unlike QPixmap) may be used outside the GUI thread
+        image = QImage(self.filepath)
+        if not image.isNull():
+            image = image.scaled(
+                self.size, self.size, Qt.KeepAspectRatio, Qt.SmoothTransformation
+            )
+        self.signals.ready.emit(self.task_id, image)
+
+
 class ImageThumbnail(QFrame):
     """A single image thumbnail with filename."""
 
@@ -42,13 +68,10 @@ class ImageThumbnail(QFrame):
         layout.setSpacing(4)
 
         # Image
-        img_label = QLabel()
-        img_label.setAlignment(Qt.AlignCenter)
-        img_label.setPixmap(pixmap.scaled(
-            self.THUMBNAIL_SIZE, self.THUMBNAIL_SIZE,
-            Qt.KeepAspectRatio, Qt.SmoothTransformation
-        ))
-        layout.addWidget(img_label)
+        self.img_label = QLabel()
+        self.img_label.setAlignment(Qt.AlignCenter)
+        self.set_pixmap(pixmap)
+        layout.addWidget(self.img_label)
 
         # Filename
         filename = Path(self.filepath).name
@@ -59,6 +82,15 @@ class ImageThumbnail(QFrame):
         name_label.setMaximumHeight(20)
         layout.addWidget(name_label)
 
+    def set_pixmap(self, pixmap):
+        """Show pixmap, scaled down to the thumbnail size if needed."""
+        if pixmap.width() > self.THUMBNAIL_SIZE or pixmap.height() > self.THUMBNAIL_SIZE:
+            pixmap = pixmap.scaled(
+                self.THUMBNAIL_SIZE, self.THUMBNAIL_SIZE,
+                Qt.KeepAspectRatio, Qt.SmoothTransformation
+            )
+        self.img_label.setPixmap(pixmap)
+
     def mousePressEvent(self, event):
         if event.button() == Qt.LeftButton:
             self.clicked.emit(self.filepath)
@@ -92,25 +124,32 @@ class PreviewGallery(QScrollArea):
         self.setWidget(self.container)
 
         self.images = []
+        self._thumbs = []  # Thumbnail widget for each entry in images
         self._columns = 4
+        # Decode task id -> thumbnail waiting for it; emptied by clear() so
+        # thumbnails decoded for old entries are dropped
+        self._pending = {}
+        self._next_task_id = 0
+        self._placeholder = None
 
     def add_image(self, filepath: str, np_image: np.ndarray):
         """Add a processed image to the gallery."""
-        # Convert numpy to QPixmap
+        # Only a thumbnail is ever shown; drop to ~2x its size with a strided
+        # view first so just the decimated pixels get copied.
         h, w = np_image.shape[:2]
+        step = max(1, min(h, w) // (2 * ImageThumbnail.THUMBNAIL_SIZE))
+        small = np.ascontiguousarray(np_image[::step, ::step])
+        h, w = small.shape[:2]
 
-        if len(np_image.shape) == 2:
+        if small.ndim == 2:
             # Grayscale
-            bytes_per_line = w
             fmt = QImage.Format_Grayscale8
         else:
             # RGB
-            bytes_per_line = w * 3
             fmt = QImage.Format_RGB888
 
-        # Make a copy to ensure data persists
-        img_copy = np_image.copy()
-        q_image = QImage(img_copy.data, w, h, bytes_per_line, fmt)
+        # QImage only wraps small's buffer; copy() detaches the (small) result
+        q_image = QImage(small.data, w, h, small.strides[0], fmt)
         pixmap = QPixmap.fromImage(q_image.copy())
 
         # Create thumbnail widget
@@ -124,12 +163,19 @@ class PreviewGallery(QScrollArea):
         self.grid_layout.addWidget(thumb, row, col)
 
         self.images.append((filepath, pixmap))
+        self._thumbs.append(thumb)
 
     def add_image_from_file(self, filepath: str):
-        """Add an image to the gallery from file path."""
-        pixmap = QPixmap(filepath)
-        if pixmap.isNull():
-            return
+        """Add an image to the gallery from file path.
+
+        The file is decoded and scaled on the global thread pool; a grey
+        placeholder is shown until the thumbnail arrives.
+        """
+        if self._placeholder is None:
+            size = ImageThumbnail.THUMBNAIL_SIZE
+            self._placeholder = QPixmap(size, size)
+            self._placeholder.fill(QColor("#3D4259"))
+        pixmap = self._placeholder
 
         thumb = ImageThumbnail(filepath, pixmap)
         thumb.clicked.connect(self.image_clicked.emit)
@@ -140,29 +186,60 @@ class PreviewGallery(QScrollArea):
         self.grid_layout.addWidget(thumb, row, col)
 
         self.images.append((filepath, pixmap))
+        self._thumbs.append(thumb)
+
+        task_id = self._next_task_id
+        self._next_task_id += 1
+        self._pending[task_id] = thumb
+        task = ThumbnailDecodeTask(filepath, ImageThumbnail.THUMBNAIL_SIZE, task_id)
+        task.signals.ready.connect(self._on_thumbnail_ready)
+        QThreadPool.globalInstance().start(task)
+
+    def _on_thumbnail_ready(self, task_id, image):
+        thumb = self._pending.pop(task_id, None)
+        if thumb is None:
+            return
+        index = self._thumbs.index(thumb)
+        if image.isNull():
+            # Drop the entry so it isn't counted as a loaded image
+            print(f"Could not load image: {thumb.filepath}")
+            del self.images[index]
+            del self._thumbs[index]
+            self.grid_layout.removeWidget(thumb)
+            thumb.deleteLater()
+            self._reflow()
+            return
+        pixmap = QPixmap.fromImage(image)
+        self.images[index] = (thumb.filepath, pixmap)
+        thumb.set_pixmap(pixmap)
 
     def clear(self):
         """Clear all images from the gallery."""
+        self._remove_thumbnails()
+        self.images.clear()
+        self._thumbs.clear()
+        self._pending.clear()
+
+    def _remove_thumbnails(self):
         while self.grid_layout.count():
             item = self.grid_layout.takeAt(0)
             if item.widget():
                 item.widget().deleteLater()
-        self.images.clear()
 
     def set_columns(self, columns):
         """Set the number of columns for the grid."""
         self._columns = max(1, columns)
-        # Rebuild grid layout if needed
-        if self.images:
-            # Store images
-            stored = self.images.copy()
-            self.clear()
-            # Re-add
-            for filepath, pixmap in stored:
-                thumb = ImageThumbnail(filepath, pixmap)
-                thumb.clicked.connect(self.image_clicked.emit)
-                idx = len(self.images)
-                row = idx // self._columns
-                col = idx % self._columns
-                self.grid_layout.addWidget(thumb, row, col)
-                self.images.append((filepath, pixmap))
+        self._reflow()
+
+    def _reflow(self):
+        """Move the existing thumbnails to their cells and repaint once."""
+        if not self._thumbs:
+            return
+        self.setUpdatesEnabled(False)
+        try:
+            for thumb in self._thumbs:
+                self.grid_layout.removeWidget(thumb)
+            for idx, thumb in enumerate(self._thumbs):
+                self.grid_layout.addWidget(thumb, idx // self._columns, idx % self._columns)
+        finally:
+            self.setUpdatesEnabled(True)
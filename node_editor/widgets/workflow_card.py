@@ -2,9 +2,60 @@
 Workflow Card Widget - A clickable card displaying workflow thumbnail and info.
 """
 from PySide6.QtWidgets import QFrame, QVBoxLayout, QHBoxLayout, QLabel, QPushButton
-from PySide6.QtCore import Qt, Signal
-from PySide6.QtGui import QPixmap
+from PySide6.QtCore import Qt, Signal, QObject, QRunnable, QThreadPool
+from PySide6.QtGui import QPixmap, QImage
+from collections import OrderedDict
 import base64
+import hashlib
+
+# Cards are rebuilt whenever the workflow list refreshes; keep the scaled
+# thumbnails so the same data is not decoded again (LRU, GUI thread only).
+THUMB_CACHE_SIZE = 256
+_THUMB_CACHE = OrderedDict()
+
+
+def _thumb_key(base64_str):
+    return hashlib.blake2b(base64_str.encode(), digest_size=16).digest()
+
+
+def decode_thumbnail(base64_str):
+    """Decode a base64 data-URL thumbnail to a QImage (None if invalid)."""
+    if not base64_str or not base64_str.startswith("data:image"):
+        return None
+    try:
+        _, data = base64_str.split(",", 1)
+        image = QImage()
+        image.loadFromData(base64.b64decode(data))
+        return image
+    except Exception:
+        return None
+
+
+class _ThumbnailSignals(QObject):
+    """Carries a decoded card thumbnail back to the GUI thread."""
+
+    ready = Signal(QImage)
+
+
+class Base64ThumbnailTask(QRunnable):
+    """Decode and scale a base64 data-URL thumbnail off the GUI thread."""
+
+    def __init__(self, base64_str, width, height):
+        super().__init__()
+        self.base64_str = base64_str
+        self.width = width
+        self.height = height
+        self.signals = _ThumbnailSignals()
+
+    def run(self):
+        image = decode_thumbnail(self.base64_str)
+        if image is not None and not image.isNull():
+            image = image.scaled(
+                self.width, self.height, Qt.KeepAspectRatio, Qt.SmoothTransformation
+            )
+        else:
+            image = QImage()
+        self.signals.ready.emit(image)
 
 
 class WorkflowCard(QFrame):
@@ -18,39 +69,28 @@ class WorkflowCard(QFrame):
         super().__init__(parent)
         self.workflow_data = workflow_data
         self._is_selected = False
+        # The thumbnail is decoded on the thread pool the first time the
+        # card is shown
+        self._thumb_data_raw = None
+        self._already_decoded = False
+        self.setProperty("selected", False)
         self._setup_ui()
-        self._apply_style()
         self.setCursor(Qt.PointingHandCursor)
 
-    def _apply_style(self):
-        if self._is_selected:
-            self.setStyleSheet("""
-                WorkflowCard {
-                    background: #3D4259;
-                    border: 2px solid #7986CB;
-                    border-radius: 8px;
-                    padding: 8px;
-                }
-            """)
-        else:
-            self.setStyleSheet("""
-                WorkflowCard {
-                    background: #353849;
-                    border: 1px solid #4A4F6A;
-                    border-radius: 8px;
-                    padding: 8px;
-                }
-                WorkflowCard:hover {
-                    border-color: #5C6BC0;
-                    background: #3D4259;
-                }
-            """)
-
     def set_selected(self, selected):
+        if selected == self._is_selected:
+            return
         self._is_selected = selected
-        self._apply_style()
+        # Styled by the app stylesheet; re-polish so the [selected] rule applies
+        self.setProperty("selected", selected)
+        self.style().unpolish(self)
+        self.style().polish(self)
+        self.update()
 
     def _setup_ui(self):
+        meta = self.workflow_data.get('metadata') or {}
+        nodes = self.workflow_data.get('nodes') or ()
+
         layout = QVBoxLayout(self)
         layout.setSpacing(6)
         layout.setContentsMargins(8, 8, 8, 8)
@@ -66,23 +106,18 @@ class WorkflowCard(QFrame):
             font-size: 11px;
         """)
 
-        # Load thumbnail from base64 if available
-        thumb_data = self.workflow_data.get('metadata', {}).get('thumbnail')
+        # Load thumbnail from base64 if available (see showEvent)
+        thumb_data = meta.get('thumbnail')
         if thumb_data:
-            pixmap = self._decode_thumbnail(thumb_data)
-            if pixmap and not pixmap.isNull():
-                self.thumbnail_label.setPixmap(pixmap.scaled(
-                    160, 100, Qt.KeepAspectRatio, Qt.SmoothTransformation
-                ))
-            else:
-                self.thumbnail_label.setText("No Preview")
+            self._thumb_data_raw = thumb_data
+            self.thumbnail_label.setText("Loading...")
         else:
             self.thumbnail_label.setText("No Preview")
 
         layout.addWidget(self.thumbnail_label, alignment=Qt.AlignCenter)
 
         # Name
-        name = self.workflow_data.get('metadata', {}).get('name', 'Untitled')
+        name = meta.get('name', 'Untitled')
         self.name_label = QLabel(name)
         self.name_label.setStyleSheet("font-weight: bold; color: #E0E0E0; font-size: 13px;")
         self.name_label.setAlignment(Qt.AlignCenter)
@@ -90,23 +125,35 @@ class WorkflowCard(QFrame):
         layout.addWidget(self.name_label)
 
         # Node count
-        node_count = len(self.workflow_data.get('nodes', []))
+        node_count = len(nodes)
         count_label = QLabel(f"{node_count} nodes")
         count_label.setStyleSheet("color: #888; font-size: 11px;")
         count_label.setAlignment(Qt.AlignCenter)
         layout.addWidget(count_label)
 
-    def _decode_thumbnail(self, base64_str):
-        """Decode base64 thumbnail to QPixmap."""
-        if not base64_str or not base64_str.startswith("data:image"):
-            return None
-        try:
-            _, data = base64_str.split(",", 1)
-            pixmap = QPixmap()
-            pixmap.loadFromData(base64.b64decode(data))
-            return pixmap
-        except Exception:
-            return None
+    def showEvent(self, event):
+        super().showEvent(event)
+        if self._thumb_data_raw and not self._already_decoded:
+            self._already_decoded = True
+            self._thumb_key = _thumb_key(self._thumb_data_raw)
+            pixmap = _THUMB_CACHE.get(self._thumb_key)
+            if pixmap is not None:
+                _THUMB_CACHE.move_to_end(self._thumb_key)
+                self.thumbnail_label.setPixmap(pixmap)
+                return
+            task = Base64ThumbnailTask(self._thumb_data_raw, 160, 100)
+            task.signals.ready.connect(self._on_thumbnail_ready)
+            QThreadPool.globalInstance().start(task)
+
+    def _on_thumbnail_ready(self, image):
+        if image.isNull():
+            self.thumbnail_label.setText("No Preview")
+        else:
+            pixmap = QPixmap.fromImage(image)
+            _THUMB_CACHE[self._thumb_key] = pixmap
+            if len(_THUMB_CACHE) > THUMB_CACHE_SIZE:
+                _THUMB_CACHE.popitem(last=False)
+            self.thumbnail_label.setPixmap(pixmap)
 
     def mousePressEvent(self, event):
         if event.button() == Qt.LeftButton: